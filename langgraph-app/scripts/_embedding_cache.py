@@ -0,0 +1,258 @@
+"""Persistent embedding cache for the guideline ingestion script.
+
+Embeddings are stored in a SQLite database keyed by
+``sha256(model + "\\0" + text)`` so re-ingesting unchanged chunks does not
+call the OpenAI API again. Vectors are stored as packed float32 blobs.
+
+Optionally, exact-key misses can be matched against near-duplicate chunks
+(re-published guidelines often differ only in whitespace, page numbers or
+punctuation). Each stored chunk carries a MinHash signature of its normalized
+word 3-shingles, indexed with LSH banding, and a miss reuses the embedding
+of a cached chunk whose estimated Jaccard similarity meets the threshold.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import sqlite3
+from array import array
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    hash BLOB PRIMARY KEY,
+    dim INTEGER NOT NULL,
+    vec BLOB NOT NULL,
+    minhash BLOB
+);
+CREATE TABLE IF NOT EXISTS embedding_lsh (
+    model TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    bucket BLOB NOT NULL,
+    hash BLOB NOT NULL,
+    PRIMARY KEY (model, band, bucket, hash)
+);
+"""
+
+# SQLite default limit for host parameters in a single statement is 999
+_SELECT_BATCH_SIZE = 500
+
+# MinHash parameters: 64 permutations split into 8 LSH bands of 8 rows. A pair
+# with Jaccard 0.95 shares at least one band with probability > 0.999.
+MINHASH_NUM_PERM = 64
+_LSH_BANDS = 8
+_LSH_ROWS = MINHASH_NUM_PERM // _LSH_BANDS
+_MERSENNE_PRIME = (1 << 61) - 1
+# Fixed seed: signatures stored in the database must be stable across runs
+_rng = random.Random(1)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_NUM_PERM)
+]
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def embedding_key(model: str, text: str) -> bytes:
+    """Return the cache key for a text embedded with the given model.
+
+    Args:
+        model: Embedding model name.
+        text: Chunk text.
+
+    Returns:
+        32-byte SHA-256 digest.
+    """
+    return hashlib.sha256(f"{model}\0{text}".encode()).digest()
+
+
+def minhash_signature(text: str) -> array[int]:
+    """Compute the MinHash signature of a text's normalized word 3-shingles.
+
+    Args:
+        text: Chunk text (whitespace is collapsed and case folded first).
+
+    Returns:
+        Array of MINHASH_NUM_PERM unsigned 64-bit minimum hash values.
+    """
+    words = _WHITESPACE_RE.sub(" ", text).strip().lower().split(" ")
+    shingles = {" ".join(words[i : i + 3]) for i in range(max(len(words) - 2, 1))}
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+        for s in shingles
+    ]
+    return array(
+        "Q",
+        (min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS),
+    )
+
+
+def _lsh_buckets(signature: array[int]) -> list[bytes]:
+    """Split a signature into per-band bucket keys."""
+    return [
+        signature[band * _LSH_ROWS : (band + 1) * _LSH_ROWS].tobytes()
+        for band in range(_LSH_BANDS)
+    ]
+
+
+def _estimated_jaccard(left: array[int], right: array[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return sum(a == b for a, b in zip(left, right)) / MINHASH_NUM_PERM
+
+
+def _unpack_vector(blob: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """SQLite-backed cache mapping (model, text) to an embedding vector.
+
+    Example:
+        >>> with EmbeddingCache("data/embeddings.db", fuzzy_threshold=0.95) as cache:
+        ...     hits = cache.get_many("text-embedding-ada-002", chunks)
+    """
+
+    def __init__(self, path: str | Path, fuzzy_threshold: float | None = None) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite database file.
+            fuzzy_threshold: If set, exact-key misses reuse the embedding of a
+                cached chunk with estimated Jaccard similarity >= this value
+                (e.g. 0.95). None (default) disables near-duplicate lookup.
+
+        Raises:
+            ValueError: If fuzzy_threshold is not in (0, 1].
+        """
+        if fuzzy_threshold is not None and not 0 < fuzzy_threshold <= 1:
+            raise ValueError(
+                f"fuzzy_threshold must be in (0, 1], got {fuzzy_threshold}"
+            )
+        self.path = Path(path)
+        self.fuzzy_threshold = fuzzy_threshold
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        # Databases created before near-duplicate support lack the column
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(embedding_cache)")
+        }
+        if "minhash" not in columns:
+            self._conn.execute("ALTER TABLE embedding_cache ADD COLUMN minhash BLOB")
+        self._conn.commit()
+
+    def get_many(self, model: str, texts: list[str]) -> dict[int, list[float]]:
+        """Look up cached embeddings.
+
+        Args:
+            model: Embedding model name.
+            texts: Chunk texts.
+
+        Returns:
+            Mapping of index in ``texts`` to cached embedding (hits only).
+        """
+        keys = [embedding_key(model, text) for text in texts]
+        found: dict[bytes, list[float]] = {}
+        for start in range(0, len(keys), _SELECT_BATCH_SIZE):
+            batch = keys[start : start + _SELECT_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT hash, vec FROM embedding_cache WHERE hash IN ({placeholders})",
+                batch,
+            )
+            for key, blob in rows:
+                found[key] = _unpack_vector(blob)
+
+        hits = {i: found[key] for i, key in enumerate(keys) if key in found}
+
+        if self.fuzzy_threshold is not None:
+            for i, text in enumerate(texts):
+                if i not in hits:
+                    vector = self._get_near_duplicate(model, text, self.fuzzy_threshold)
+                    if vector is not None:
+                        hits[i] = vector
+
+        return hits
+
+    def _get_near_duplicate(
+        self, model: str, text: str, threshold: float
+    ) -> list[float] | None:
+        """Find the embedding of the most similar cached chunk above threshold."""
+        signature = minhash_signature(text)
+        candidates: set[bytes] = set()
+        for band, bucket in enumerate(_lsh_buckets(signature)):
+            rows = self._conn.execute(
+                "SELECT hash FROM embedding_lsh "
+                "WHERE model = ? AND band = ? AND bucket = ?",
+                (model, band, bucket),
+            )
+            candidates.update(key for (key,) in rows)
+
+        best_score, best_vec = 0.0, None
+        for key in candidates:
+            row = self._conn.execute(
+                "SELECT minhash, vec FROM embedding_cache WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None or row[0] is None:
+                continue
+            candidate = array("Q")
+            candidate.frombytes(row[0])
+            score = _estimated_jaccard(signature, candidate)
+            if score >= threshold and score > best_score:
+                best_score, best_vec = score, row[1]
+
+        return _unpack_vector(best_vec) if best_vec is not None else None
+
+    def put_many(
+        self, model: str, texts: list[str], embeddings: list[list[float]]
+    ) -> None:
+        """Store embeddings for texts in a single transaction.
+
+        Args:
+            model: Embedding model name.
+            texts: Chunk texts.
+            embeddings: Embedding vectors, positionally aligned with ``texts``.
+
+        Raises:
+            ValueError: If texts and embeddings differ in length.
+        """
+        if len(texts) != len(embeddings):
+            raise ValueError(f"Got {len(texts)} texts but {len(embeddings)} embeddings")
+        rows = []
+        lsh_rows = []
+        for text, vector in zip(texts, embeddings):
+            key = embedding_key(model, text)
+            signature = minhash_signature(text)
+            rows.append(
+                (key, len(vector), array("f", vector).tobytes(), signature.tobytes())
+            )
+            lsh_rows.extend(
+                (model, band, bucket, key)
+                for band, bucket in enumerate(_lsh_buckets(signature))
+            )
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (hash, dim, vec, minhash) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding_lsh (model, band, bucket, hash) "
+                "VALUES (?, ?, ?, ?)",
+                lsh_rows,
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> EmbeddingCache:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection on exit."""
+        self.close()
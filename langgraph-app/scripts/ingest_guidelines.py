@@ -32,14 +32,20 @@ import argparse
 import asyncio
 import csv
 import json
+import logging
 import os
 import sys
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any, BinaryIO, Callable
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _embedding_cache import EmbeddingCache
+
 from agent.models.guideline_models import GuidelineSection, GuidelineSource
 from agent.utils.pdf_processor import (
     chunk_text,
@@ -47,6 +53,199 @@ from agent.utils.pdf_processor import (
     load_pdf,
 )
 
+logger = logging.getLogger(__name__)
+
+# Chunks per embeddings request; well below OpenAI's per-request input limit
+DEFAULT_EMBEDDING_BATCH_SIZE = 96
+
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# PDFs processed at the same time in batch mode
+DEFAULT_CONCURRENCY = 4
+
+# Required columns of the batch metadata CSV
+METADATA_COLUMNS = (
+    "filename",
+    "guideline_id",
+    "title",
+    "source",
+    "publication_date",
+    "url",
+)
+
+# Suffix of the optional binary embeddings file written next to the JSON output
+EMBEDDING_SIDECAR_SUFFIX = ".emb.f32"
+
+
+async def _embed_in_batches(chunks: list[str], batch_size: int) -> list[list[float]]:
+    """Create embeddings for chunks, issuing one request per batch concurrently.
+
+    Args:
+        chunks: Text chunks to embed.
+        batch_size: Maximum number of chunks per embeddings request.
+
+    Returns:
+        Embedding vectors in the same order as ``chunks``.
+
+    Raises:
+        ValueError: If chunks is empty, batch_size is not positive or
+            OPENAI_API_KEY is not set.
+    """
+    if not chunks:
+        raise ValueError("Texts list cannot be empty")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    from openai import AsyncOpenAI
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+    batches = [chunks[i : i + batch_size] for i in range(0, len(chunks), batch_size)]
+    # One client (and connection pool) shared by all concurrent batches,
+    # closed once they finish
+    async with AsyncOpenAI(api_key=api_key) as client:
+        results = await asyncio.gather(
+            *(
+                create_embeddings(
+                    batch, model=EMBEDDING_MODEL, batch_size=batch_size, client=client
+                )
+                for batch in batches
+            )
+        )
+    return [embedding for result in results for embedding in result]
+
+
+async def _embed_with_cache(
+    chunks: list[str], batch_size: int, cache: EmbeddingCache | None
+) -> list[list[float]]:
+    """Create embeddings, reusing cached vectors for unchanged chunks.
+
+    Only cache misses are sent to the embeddings API; new vectors are written
+    back to the cache.
+
+    Args:
+        chunks: Text chunks to embed.
+        batch_size: Maximum number of chunks per embeddings request.
+        cache: Embedding cache, or None to always call the API.
+
+    Returns:
+        Embedding vectors in the same order as ``chunks``.
+
+    Raises:
+        ValueError: If chunks is empty.
+    """
+    if not chunks:
+        raise ValueError("Texts list cannot be empty")
+    if cache is None:
+        return await _embed_in_batches(chunks, batch_size)
+
+    cached = cache.get_many(EMBEDDING_MODEL, chunks)
+    uncached_indices = [i for i in range(len(chunks)) if i not in cached]
+    uncached_texts = [chunks[i] for i in uncached_indices]
+    logger.debug(
+        "Embedding cache: %d hits, %d misses", len(cached), len(uncached_texts)
+    )
+
+    if uncached_texts:
+        new_embeddings = await _embed_in_batches(uncached_texts, batch_size)
+        cache.put_many(EMBEDDING_MODEL, uncached_texts, new_embeddings)
+        cached.update(zip(uncached_indices, new_embeddings))
+
+    return [cached[i] for i in range(len(chunks))]
+
+
+def _sidecar_path(output_file: str) -> Path:
+    """Return the float32 embeddings sidecar path for a JSON output file."""
+    return Path(output_file).with_suffix(EMBEDDING_SIDECAR_SUFFIX)
+
+
+def _write_sections_json(
+    output_file: str,
+    sections: list[GuidelineSection],
+    embeddings_sidecar: bool = False,
+) -> None:
+    """Write sections to a JSON array file, one section at a time.
+
+    Each section is serialized with ``model_dump_json`` (pydantic-core), so
+    no Python dicts of the sections (embeddings make them large) are built.
+    The layout matches ``json.dump([...], indent=2, ensure_ascii=False)``.
+
+    With ``embeddings_sidecar``, embedding vectors are written as packed
+    float32 rows to ``<output>.emb.f32`` and each section's metadata holds an
+    ``embedding_ref`` ({"file", "row", "dim"}) instead of the float list.
+
+    Args:
+        output_file: Destination JSON file path.
+        sections: Sections to serialize.
+        embeddings_sidecar: Store embeddings in a binary sidecar file.
+    """
+    sidecar = _sidecar_path(output_file)
+    sidecar_f: BinaryIO | None = None
+    sidecar_rows = 0
+    try:
+        with open(output_file, "w", encoding="utf-8") as f:
+            if not sections:
+                f.write("[]")
+                return
+            f.write("[\n")
+            for i, section in enumerate(sections):
+                if i:
+                    f.write(",\n")
+                if embeddings_sidecar and "embedding" in section.metadata:
+                    metadata = dict(section.metadata)
+                    embedding = metadata.pop("embedding")
+                    if sidecar_f is None:
+                        sidecar_f = open(sidecar, "wb")
+                    array("f", embedding).tofile(sidecar_f)
+                    metadata["embedding_ref"] = {
+                        "file": sidecar.name,
+                        "row": sidecar_rows,
+                        "dim": len(embedding),
+                    }
+                    sidecar_rows += 1
+                    section = section.model_copy(update={"metadata": metadata})
+                # Serialized by pydantic-core (Rust), no intermediate dict
+                item = section.model_dump_json(indent=2)
+                # JSON strings never contain raw newlines, so this only re-indents
+                f.write("  " + item.replace("\n", "\n  "))
+            f.write("\n]")
+    finally:
+        if sidecar_f is not None:
+            sidecar_f.close()
+
+
+def load_sections_json(json_file: str) -> list[GuidelineSection]:
+    """Load sections written by this script, resolving sidecar embeddings.
+
+    Args:
+        json_file: Path to a processed guideline JSON file.
+
+    Returns:
+        GuidelineSection objects with ``metadata["embedding"]`` populated
+        (from the float32 sidecar when ``embedding_ref`` is present).
+    """
+    with open(json_file, encoding="utf-8") as f:
+        items: list[dict[str, Any]] = json.load(f)
+
+    sidecar: BinaryIO | None = None
+    try:
+        for item in items:
+            ref = item["metadata"].pop("embedding_ref", None)
+            if ref is None:
+                continue
+            if sidecar is None:
+                sidecar = open(Path(json_file).parent / ref["file"], "rb")
+            vector = array("f")
+            sidecar.seek(ref["row"] * ref["dim"] * vector.itemsize)
+            vector.fromfile(sidecar, ref["dim"])
+            item["metadata"]["embedding"] = vector.tolist()
+    finally:
+        if sidecar is not None:
+            sidecar.close()
+
+    return [GuidelineSection.model_validate(item) for item in items]
+
 
 async def ingest_guideline_pdf(
     pdf_path: str,
@@ -59,6 +258,10 @@ async def ingest_guideline_pdf(
     overlap: int = 100,
     create_embeddings_flag: bool = True,
     best_effort_embeddings: bool = False,
+    embedding_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    embedding_cache: EmbeddingCache | None = None,
+    pdf_executor: Executor | None = None,
+    ingested_at: str | None = None,
 ) -> list[GuidelineSection]:
     """Ingest single PDF guideline into GuidelineSection objects.
 
@@ -81,6 +284,15 @@ async def ingest_guideline_pdf(
         create_embeddings_flag: Whether to create embeddings (default: True).
         best_effort_embeddings: If True, continue without embeddings on failure.
             If False (default), raise exception on embedding failure.
+        embedding_batch_size: Number of chunks per embeddings request. Batches
+            are sent concurrently (default: 96).
+        embedding_cache: Optional persistent cache; only chunks missing from
+            the cache are sent to the embeddings API.
+        pdf_executor: Executor for PDF parsing, e.g. a ProcessPoolExecutor to
+            parse several PDFs in parallel across cores. None (default) uses
+            the event loop's default thread pool.
+        ingested_at: ISO timestamp stored in each section's metadata. Batch
+            runs pass one timestamp for the whole run; defaults to now.
 
     Returns:
         List of GuidelineSection objects with embeddings in metadata.
@@ -90,45 +302,53 @@ async def ingest_guideline_pdf(
         PDFReadError: If PDF cannot be parsed.
         RuntimeError: If embeddings creation fails and best_effort_embeddings=False.
     """
-    print(f"Processing: {pdf_path}")
+    logger.info("Processing: %s", pdf_path)
 
     # Step 1: Load PDF
-    print("  Loading PDF...")
-    raw_text = load_pdf(pdf_path)
-    print(f"  Extracted {len(raw_text)} characters")
+    # PDF parsing is CPU-bound; keep the event loop free for other files
+    loop = asyncio.get_running_loop()
+    raw_text = await loop.run_in_executor(pdf_executor, load_pdf, pdf_path)
+    logger.debug("%s: extracted %d characters", pdf_path, len(raw_text))
 
     # Step 2: Chunk text
-    print("  Chunking text...")
     chunks = chunk_text(raw_text, chunk_size=chunk_size, overlap=overlap)
-    print(f"  Created {len(chunks)} chunks")
+    logger.debug("%s: created %d chunks", pdf_path, len(chunks))
 
     # Step 3: Create embeddings (optional)
     embeddings: list[list[float]] | None = None
     if create_embeddings_flag:
-        print("  Creating embeddings...")
         try:
-            embeddings = await create_embeddings(chunks)
-            print(f"  Created {len(embeddings)} embeddings (1536 dim)")
+            embeddings = await _embed_with_cache(
+                chunks, embedding_batch_size, embedding_cache
+            )
+            logger.debug("%s: created %d embeddings", pdf_path, len(embeddings))
         except Exception as e:
             if best_effort_embeddings:
-                print(f"  Warning: Failed to create embeddings: {e}")
-                print("  Continuing without embeddings (best_effort_embeddings=True)")
+                logger.warning(
+                    "%s: failed to create embeddings: %s - continuing without "
+                    "embeddings (best_effort_embeddings=True)",
+                    pdf_path,
+                    e,
+                )
                 embeddings = None
             else:
-                print(f"  Error: Failed to create embeddings: {e}")
+                logger.error("%s: failed to create embeddings: %s", pdf_path, e)
                 raise RuntimeError(
                     f"Embedding creation failed for {pdf_path}: {e}. "
                     "Set best_effort_embeddings=True to continue without embeddings."
                 ) from e
 
     # Step 4: Create GuidelineSection objects
-    print("  Creating GuidelineSection objects...")
     sections: list[GuidelineSection] = []
+    # Same timestamp for every section of this guideline
+    if ingested_at is None:
+        ingested_at = datetime.now().isoformat()
+    total_chunks = len(chunks)
 
     for i, chunk in enumerate(chunks):
         # Extract section name from chunk (first line or first sentence)
-        lines = chunk.split("\n")
-        first_line = lines[0].strip()
+        newline_idx = chunk.find("\n")
+        first_line = (chunk if newline_idx == -1 else chunk[:newline_idx]).strip()
 
         # Use first line as section name if it looks like a header
         if len(first_line) < 100 and first_line:
@@ -139,29 +359,31 @@ async def ingest_guideline_pdf(
             if len(chunk) > 80:
                 section_name += "..."
 
-        section = GuidelineSection(
-            guideline_id=guideline_id,
-            title=title,
-            section_name=f"{section_name} (Part {i + 1}/{len(chunks)})",
-            content=chunk,
-            publication_date=publication_date,
-            source=source,
-            url=url,
-        )
-
+        metadata: dict[str, Any] = {}
         # Add embedding to metadata if available
         if embeddings and i < len(embeddings):
-            section.metadata["embedding"] = embeddings[i]
-            section.metadata["embedding_model"] = "text-embedding-ada-002"
-            section.metadata["embedding_dim"] = 1536
-
-        section.metadata["chunk_index"] = i
-        section.metadata["total_chunks"] = len(chunks)
-        section.metadata["ingested_at"] = datetime.now().isoformat()
-
-        sections.append(section)
-
-    print(f"  Created {len(sections)} GuidelineSection objects")
+            metadata["embedding"] = embeddings[i]
+            metadata["embedding_model"] = EMBEDDING_MODEL
+            metadata["embedding_dim"] = 1536
+        metadata["chunk_index"] = i
+        metadata["total_chunks"] = total_chunks
+        metadata["ingested_at"] = ingested_at
+
+        fields: dict[str, Any] = {
+            "guideline_id": guideline_id,
+            "title": title,
+            "section_name": f"{section_name} (Part {i + 1}/{total_chunks})",
+            "content": chunk,
+            "publication_date": publication_date,
+            "source": source,
+            "url": url,
+            "metadata": metadata,
+        }
+        # Validate every section: section_name, content and metadata come from
+        # PDF text and differ per chunk
+        sections.append(GuidelineSection(**fields))
+
+    logger.debug("%s: created %d GuidelineSection objects", pdf_path, len(sections))
     return sections
 
 
@@ -173,6 +395,11 @@ async def ingest_directory(
     overlap: int = 100,
     create_embeddings_flag: bool = True,
     best_effort_embeddings: bool = False,
+    embedding_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    embedding_cache: EmbeddingCache | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    embeddings_sidecar: bool = False,
+    pdf_executor: Executor | None = None,
 ) -> dict[str, list[GuidelineSection]]:
     """Batch ingest all PDFs in directory using metadata CSV.
 
@@ -187,12 +414,29 @@ async def ingest_directory(
         overlap: Overlap between chunks.
         create_embeddings_flag: Whether to create embeddings.
         best_effort_embeddings: If True, continue without embeddings on failure.
+        embedding_batch_size: Number of chunks per embeddings request.
+        embedding_cache: Optional persistent embedding cache.
+        concurrency: Maximum number of PDFs processed at the same time.
+        embeddings_sidecar: Write embeddings to float32 sidecar files instead
+            of inline JSON lists.
+        pdf_executor: Executor for PDF parsing (default: thread pool).
 
     Returns:
         Dictionary mapping guideline_id to list of GuidelineSection objects.
+
+    Raises:
+        ValueError: If concurrency or embedding_batch_size is less than 1, or
+            the metadata CSV lacks a required column.
     """
-    print(f"Batch processing from: {guidelines_dir}")
-    print(f"Using metadata from: {metadata_csv}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    if embedding_batch_size < 1:
+        raise ValueError(
+            f"embedding_batch_size must be >= 1, got {embedding_batch_size}"
+        )
+
+    logger.info("Batch processing from: %s", guidelines_dir)
+    logger.info("Using metadata from: %s", metadata_csv)
 
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
@@ -200,62 +444,103 @@ async def ingest_directory(
     results: dict[str, list[GuidelineSection]] = {}
     errors: list[str] = []
 
-    # Read metadata CSV
-    with open(metadata_csv, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
+    semaphore = asyncio.Semaphore(concurrency)
+    # One ingestion timestamp for the whole batch run
+    run_started_at = datetime.now().isoformat()
 
-        for row in reader:
-            filename = row["filename"]
-            pdf_path = os.path.join(guidelines_dir, filename)
+    async def process_row(row: list[str]) -> None:
+        if len(row) < len(idx):
+            errors.append(f"Malformed metadata row: {row}")
+            return
+        filename = row[idx["filename"]]
+        guideline_id = row[idx["guideline_id"]]
+        pdf_path = os.path.join(guidelines_dir, filename)
 
-            if not os.path.exists(pdf_path):
-                errors.append(f"File not found: {pdf_path}")
-                continue
+        if not os.path.exists(pdf_path):
+            errors.append(f"File not found: {pdf_path}")
+            return
 
-            try:
-                # Parse source enum
-                source_str = row["source"].lower()
-                source = GuidelineSource(source_str)
+        try:
+            # Parse source enum
+            source_str = row[idx["source"]].lower()
+            source = GuidelineSource(source_str)
 
+            async with semaphore:
                 sections = await ingest_guideline_pdf(
                     pdf_path=pdf_path,
-                    guideline_id=row["guideline_id"],
-                    title=row["title"],
+                    guideline_id=guideline_id,
+                    title=row[idx["title"]],
                     source=source,
-                    publication_date=row["publication_date"],
-                    url=row["url"],
+                    publication_date=row[idx["publication_date"]],
+                    url=row[idx["url"]],
                     chunk_size=chunk_size,
                     overlap=overlap,
                     create_embeddings_flag=create_embeddings_flag,
                     best_effort_embeddings=best_effort_embeddings,
+                    embedding_batch_size=embedding_batch_size,
+                    embedding_cache=embedding_cache,
+                    pdf_executor=pdf_executor,
+                    ingested_at=run_started_at,
                 )
 
-                results[row["guideline_id"]] = sections
+            results[guideline_id] = sections
 
-                # Save individual JSON file
-                output_file = os.path.join(output_dir, f"{row['guideline_id']}.json")
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(
-                        [s.model_dump() for s in sections],
-                        f,
-                        indent=2,
-                        ensure_ascii=False,
-                    )
-                print(f"  Saved: {output_file}")
+            # Save individual JSON file. The semaphore slot is already released,
+            # so the next PDF's parsing/embedding overlaps with this disk write.
+            output_file = os.path.join(output_dir, f"{guideline_id}.json")
+            await asyncio.to_thread(
+                _write_sections_json, output_file, sections, embeddings_sidecar
+            )
+            logger.info("Saved: %s", output_file)
 
-            except Exception as e:
-                errors.append(f"Error processing {filename}: {e}")
+        except Exception as e:
+            errors.append(f"Error processing {filename}: {e}")
+
+    # Read metadata CSV; resolve column positions once from the header
+    with open(metadata_csv, newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        idx = {name: i for i, name in enumerate(header)}
+        missing = [column for column in METADATA_COLUMNS if column not in idx]
+        if missing:
+            raise ValueError(
+                f"Metadata CSV {metadata_csv} is missing columns: {', '.join(missing)}"
+            )
+        # Skip blank lines (DictReader did the same)
+        rows = [row for row in reader if row]
+
+    # Process all PDFs concurrently, at most `concurrency` at a time
+    outcomes = await asyncio.gather(
+        *(process_row(row) for row in rows), return_exceptions=True
+    )
+    for row, outcome in zip(rows, outcomes):
+        if isinstance(outcome, BaseException):
+            errors.append(f"Error processing {row[idx['filename']]}: {outcome}")
 
-    # Report errors
+    # Report errors (sorted: completion order varies between runs)
     if errors:
-        print("\nErrors:")
-        for error in errors:
-            print(f"  - {error}")
+        for error in sorted(errors):
+            logger.error("%s", error)
 
-    print(f"\nProcessed {len(results)} guidelines, {len(errors)} errors")
+    logger.info("Processed %d guidelines, %d errors", len(results), len(errors))
     return results
 
 
+def _int_at_least(minimum: int) -> Callable[[str], int]:
+    """Build an argparse type accepting integers >= minimum."""
+
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be >= {minimum}, got {number}")
+        return number
+
+    return parse
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -310,79 +595,155 @@ def main() -> None:
         action="store_true",
         help="Continue without embeddings if creation fails (default: fail on error)",
     )
+    parser.add_argument(
+        "--embedding-batch-size",
+        type=_int_at_least(1),
+        default=DEFAULT_EMBEDDING_BATCH_SIZE,
+        help=(
+            "Chunks per embeddings request, batches run concurrently "
+            f"(default: {DEFAULT_EMBEDDING_BATCH_SIZE})"
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_int_at_least(1),
+        default=DEFAULT_CONCURRENCY,
+        help=f"PDFs processed concurrently in batch mode (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--pdf-workers",
+        type=_int_at_least(0),
+        default=0,
+        help=(
+            "Parse PDFs in a pool of this many processes (parallel across cores); "
+            "0 uses a thread (default: 0)"
+        ),
+    )
+    parser.add_argument(
+        "--embeddings-sidecar",
+        action="store_true",
+        help=(
+            f"Store embeddings as float32 rows in a '{EMBEDDING_SIDECAR_SUFFIX}' "
+            "file next to the JSON output (referenced by metadata.embedding_ref)"
+        ),
+    )
+    parser.add_argument(
+        "--embedding-cache",
+        help="SQLite file caching embeddings by chunk hash (skips unchanged chunks)",
+    )
+    parser.add_argument(
+        "--embedding-cache-fuzzy-threshold",
+        type=float,
+        help=(
+            "Also reuse cached embeddings of near-duplicate chunks whose "
+            "estimated Jaccard similarity is at least this value (e.g. 0.95)"
+        ),
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Log per-PDF processing steps (default: progress and errors only)",
+    )
 
     args = parser.parse_args()
 
-    # Validate arguments
-    if args.batch:
-        # Batch mode
-        if not args.metadata:
-            parser.error("--metadata required for batch processing")
-        if not args.output_dir:
-            parser.error("--output-dir required for batch processing")
-
-        asyncio.run(
-            ingest_directory(
-                guidelines_dir=args.batch,
-                metadata_csv=args.metadata,
-                output_dir=args.output_dir,
-                chunk_size=args.chunk_size,
-                overlap=args.overlap,
-                create_embeddings_flag=not args.no_embeddings,
-                best_effort_embeddings=args.best_effort_embeddings,
-            )
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Only this script's logger goes to DEBUG; keep HTTP client libraries quiet
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    embedding_cache = (
+        EmbeddingCache(
+            args.embedding_cache,
+            fuzzy_threshold=args.embedding_cache_fuzzy_threshold,
         )
+        if args.embedding_cache
+        else None
+    )
+    pdf_executor = (
+        ProcessPoolExecutor(max_workers=args.pdf_workers) if args.pdf_workers else None
+    )
 
-    elif args.pdf:
-        # Single PDF mode
-        if not all([args.guideline_id, args.title, args.date, args.url]):
-            parser.error(
-                "--id, --title, --date, and --url required for single PDF mode"
+    try:
+        # Validate arguments
+        if args.batch:
+            # Batch mode
+            if not args.metadata:
+                parser.error("--metadata required for batch processing")
+            if not args.output_dir:
+                parser.error("--output-dir required for batch processing")
+
+            asyncio.run(
+                ingest_directory(
+                    guidelines_dir=args.batch,
+                    metadata_csv=args.metadata,
+                    output_dir=args.output_dir,
+                    chunk_size=args.chunk_size,
+                    overlap=args.overlap,
+                    create_embeddings_flag=not args.no_embeddings,
+                    best_effort_embeddings=args.best_effort_embeddings,
+                    embedding_batch_size=args.embedding_batch_size,
+                    embedding_cache=embedding_cache,
+                    concurrency=args.concurrency,
+                    embeddings_sidecar=args.embeddings_sidecar,
+                    pdf_executor=pdf_executor,
+                )
             )
 
-        try:
-            source = GuidelineSource(args.source.lower())
-        except ValueError:
-            parser.error(f"Invalid source: {args.source}")
-
-        sections = asyncio.run(
-            ingest_guideline_pdf(
-                pdf_path=args.pdf,
-                guideline_id=args.guideline_id,
-                title=args.title,
-                source=source,
-                publication_date=args.date,
-                url=args.url,
-                chunk_size=args.chunk_size,
-                overlap=args.overlap,
-                create_embeddings_flag=not args.no_embeddings,
-                best_effort_embeddings=args.best_effort_embeddings,
-            )
-        )
+        elif args.pdf:
+            # Single PDF mode
+            if not all([args.guideline_id, args.title, args.date, args.url]):
+                parser.error(
+                    "--id, --title, --date, and --url required for single PDF mode"
+                )
 
-        # Save to JSON if output specified
-        if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                json.dump(
-                    [s.model_dump() for s in sections],
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
+            try:
+                source = GuidelineSource(args.source.lower())
+            except ValueError:
+                parser.error(f"Invalid source: {args.source}")
+
+            sections = asyncio.run(
+                ingest_guideline_pdf(
+                    pdf_path=args.pdf,
+                    guideline_id=args.guideline_id,
+                    title=args.title,
+                    source=source,
+                    publication_date=args.date,
+                    url=args.url,
+                    chunk_size=args.chunk_size,
+                    overlap=args.overlap,
+                    create_embeddings_flag=not args.no_embeddings,
+                    best_effort_embeddings=args.best_effort_embeddings,
+                    embedding_batch_size=args.embedding_batch_size,
+                    embedding_cache=embedding_cache,
+                    pdf_executor=pdf_executor,
                 )
-            print(f"Saved to: {args.output}")
+            )
+
+            # Save to JSON if output specified
+            if args.output:
+                _write_sections_json(args.output, sections, args.embeddings_sidecar)
+                logger.info("Saved to: %s", args.output)
+            else:
+                # Print summary
+                print("\nSummary:")
+                print(f"  Guideline ID: {args.guideline_id}")
+                print(f"  Title: {args.title}")
+                print(f"  Sections: {len(sections)}")
+                for i, section in enumerate(sections[:3]):
+                    print(f"  [{i + 1}] {section.section_name[:60]}...")
+                if len(sections) > 3:
+                    print(f"  ... and {len(sections) - 3} more sections")
+
         else:
-            # Print summary
-            print("\nSummary:")
-            print(f"  Guideline ID: {args.guideline_id}")
-            print(f"  Title: {args.title}")
-            print(f"  Sections: {len(sections)}")
-            for i, section in enumerate(sections[:3]):
-                print(f"  [{i + 1}] {section.section_name[:60]}...")
-            if len(sections) > 3:
-                print(f"  ... and {len(sections) - 3} more sections")
-
-    else:
-        parser.print_help()
+            parser.print_help()
+
+    finally:
+        if pdf_executor is not None:
+            pdf_executor.shutdown()
+        if embedding_cache is not None:
+            embedding_cache.close()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,15 @@
 This module defines a custom graph.
 """
 
-from agent.graph import graph
+from typing import Any
 
 __all__ = ["graph"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the compiled graph on first access (PEP 562)."""
+    if name == "graph":
+        from agent.graph import graph
+
+        return graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,10 +6,12 @@ Implements Constitution Principles I-V.
 
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Annotated, Any, Literal, Sequence
+from typing import TYPE_CHECKING, Annotated, Any, Final, Literal, Sequence
 
 from dotenv import load_dotenv
 from langchain_core.documents import Document
@@ -17,70 +19,134 @@ from langchain_core.messages import AnyMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.runtime import Runtime
-from langgraph.types import Command, Send
+from langgraph.types import Command
 from typing_extensions import TypedDict
 
-from agent.mcp import BioMCPClient, MCPConfig, SUKLMCPClient
 from agent.models.drug_models import DrugQuery
 from agent.models.guideline_models import GuidelineQuery
 from agent.models.research_models import ResearchQuery
-from agent.nodes import drug_agent_node
-from agent.nodes.general_agent import general_agent_node
-from agent.nodes.guidelines_agent import guidelines_agent_node
-from agent.nodes.pubmed_agent import pubmed_agent_node
-from agent.nodes.supervisor import supervisor_node
-from agent.nodes.synthesizer import synthesizer_node
+
+# Keyword sets used to live here; re-exported for `from agent.graph import ...`
+from agent.utils.keyword_routing import DRUG_KEYWORDS as DRUG_KEYWORDS
+from agent.utils.keyword_routing import GUIDELINES_KEYWORDS as GUIDELINES_KEYWORDS
+from agent.utils.keyword_routing import RESEARCH_KEYWORDS as RESEARCH_KEYWORDS
+from agent.utils.keyword_routing import (
+    match_keyword_categories,
+    normalize_keyword_text,
+)
 from agent.utils.message_utils import extract_message_content
 
-# Load environment variables (LangSmith tracing)
-load_dotenv()
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+    from agent.mcp import BioMCPClient, SUKLMCPClient
+
+# Node callables are imported when the graph is built (see build_graph), so
+# importing this module for State/Context does not load LLM and MCP clients.
+# They stay importable from here for backwards compatibility.
+_LAZY_NODE_EXPORTS = {
+    "drug_agent_node": "agent.nodes.drug_agent",
+    "general_agent_node": "agent.nodes.general_agent",
+    "guidelines_agent_node": "agent.nodes.guidelines_agent",
+    "pubmed_agent_node": "agent.nodes.pubmed_agent",
+    "supervisor_node": "agent.nodes.supervisor",
+    "synthesizer_node": "agent.nodes.synthesizer",
+}
 
 logger = logging.getLogger(__name__)
 
-# Initialize LangSmith tracing with graceful degradation
-try:
-    langsmith_api_key = os.getenv("LANGSMITH_API_KEY")
-    if langsmith_api_key:
-        os.environ.setdefault("LANGSMITH_TRACING", "true")
-        logger.info("LangSmith tracing enabled")
-    else:
-        logger.info(
-            "LangSmith: No API key found - tracing disabled (graceful degradation)"
+
+@functools.cache
+def _init_environment() -> None:
+    """Load .env and initialize LangSmith tracing (once per process).
+
+    Called when the graph or the default MCP clients are built rather than at
+    import, so importing this module for State/Context stays side-effect free.
+    Set ``LOAD_DOTENV=0`` in deployments whose environment is injected by the
+    platform to skip the .env lookup entirely.
+    """
+    if os.getenv("LOAD_DOTENV", "1") != "0":
+        load_dotenv()
+
+    # Initialize LangSmith tracing with graceful degradation
+    try:
+        langsmith_api_key = os.getenv("LANGSMITH_API_KEY")
+        if langsmith_api_key:
+            os.environ.setdefault("LANGSMITH_TRACING", "true")
+            logger.info("LangSmith tracing enabled")
+        else:
+            # Explicitly off, so LangChain skips tracer setup on every run
+            os.environ.setdefault("LANGSMITH_TRACING", "false")
+            os.environ.setdefault("LANGCHAIN_TRACING_V2", "false")
+            logger.info(
+                "LangSmith: No API key found - tracing disabled (graceful degradation)"
+            )
+    except (ImportError, OSError, ValueError) as e:
+        logger.warning(
+            "LangSmith tracing initialization warning: %s - continuing without tracing",
+            e,
         )
-except (ImportError, OSError, ValueError) as e:
-    logger.warning(
-        "LangSmith tracing initialization warning: %s - continuing without tracing", e
-    )
 
-# Initialize MCP clients for dev server (Feature 002)
-_mcp_config = MCPConfig.from_env()
-_sukl_client: SUKLMCPClient | None = None
-_biomcp_client: BioMCPClient | None = None
 
-try:
-    _sukl_client = SUKLMCPClient(
-        base_url=_mcp_config.sukl_url,
-        timeout=_mcp_config.sukl_timeout,
-        default_retry_config=_mcp_config.to_retry_config(),
-    )
-    logger.info("SÚKL MCP client initialized: %s", _mcp_config.sukl_url)
-except (OSError, ConnectionError, ValueError) as e:
-    logger.warning(
-        "Failed to initialize SÚKL client: %s - drug agent will be unavailable", e
-    )
+# MCP clients for dev server (Feature 002) are created on first use, so merely
+# importing this module (tests, scripts, CLI) does not build any clients. Both
+# open their sessions on the shared connection pool (connection_pool).
+@functools.cache
+def get_sukl_client() -> SUKLMCPClient | None:
+    """Return the shared SÚKL MCP client, creating it on first call.
+
+    Returns:
+        SUKLMCPClient configured from environment, or None if initialization failed.
+    """
+    from agent.mcp import MCPConfig, SUKLMCPClient
+
+    _init_environment()
+    mcp_config = MCPConfig.from_env()
+    try:
+        client = SUKLMCPClient(
+            base_url=mcp_config.sukl_url,
+            timeout=mcp_config.sukl_timeout,
+            default_retry_config=mcp_config.to_retry_config(),
+            share_connector=True,
+        )
+    except (OSError, ConnectionError, ValueError) as e:
+        logger.warning(
+            "Failed to initialize SÚKL client: %s - drug agent will be unavailable", e
+        )
+        return None
+    logger.info("SÚKL MCP client initialized: %s", mcp_config.sukl_url)
+    return client
 
-try:
-    _biomcp_client = BioMCPClient(
-        base_url=_mcp_config.biomcp_url,
-        timeout=_mcp_config.biomcp_timeout,
-        max_results=_mcp_config.biomcp_max_results,
-        default_retry_config=_mcp_config.to_retry_config(),
-    )
-    logger.info("BioMCP client initialized: %s", _mcp_config.biomcp_url)
-except (OSError, ConnectionError, ValueError) as e:
-    logger.warning(
-        "Failed to initialize BioMCP client: %s - PubMed agent will be unavailable", e
-    )
+
+@functools.cache
+def get_biomcp_client() -> BioMCPClient | None:
+    """Return the shared BioMCP client, creating it on first call.
+
+    Returns:
+        BioMCPClient configured from environment, or None if initialization failed.
+    """
+    from agent.mcp import BioMCPClient, CircuitBreaker, MCPConfig
+
+    _init_environment()
+    mcp_config = MCPConfig.from_env()
+    try:
+        client = BioMCPClient(
+            base_url=mcp_config.biomcp_url,
+            timeout=mcp_config.biomcp_timeout,
+            max_results=mcp_config.biomcp_max_results,
+            default_retry_config=mcp_config.to_retry_config(),
+            share_connector=True,
+            cache_ttl=mcp_config.biomcp_cache_ttl,
+            circuit_breaker=CircuitBreaker(),
+        )
+    except (OSError, ConnectionError, ValueError) as e:
+        logger.warning(
+            "Failed to initialize BioMCP client: %s - PubMed agent will be unavailable",
+            e,
+        )
+        return None
+    logger.info("BioMCP client initialized: %s", mcp_config.biomcp_url)
+    return client
 
 
 def get_mcp_clients(
@@ -89,8 +155,8 @@ def get_mcp_clients(
     """Get MCP clients from runtime context with fallback to module-level instances.
 
     Helper function for nodes to access MCP clients. Checks runtime.context first,
-    then falls back to module-level _sukl_client and _biomcp_client initialized
-    at module load time from environment variables.
+    then falls back to the shared clients from get_sukl_client() and
+    get_biomcp_client(), created from environment variables on first use.
 
     Args:
         runtime: LangGraph Runtime instance with optional context.
@@ -109,15 +175,36 @@ def get_mcp_clients(
     sukl = context.get("sukl_mcp_client")
     biomcp = context.get("biomcp_client")
 
-    # Fallback to module-level clients (dev server default)
+    # Fallback to shared clients (dev server default)
     if sukl is None:
-        sukl = _sukl_client
+        sukl = get_sukl_client()
     if biomcp is None:
-        biomcp = _biomcp_client
+        biomcp = get_biomcp_client()
 
     return sukl, biomcp
 
 
+async def close_mcp_clients() -> None:
+    """Close the HTTP sessions of the shared MCP clients.
+
+    Only clients that were already created are closed; the factories are then
+    reset so a later get_sukl_client()/get_biomcp_client() call starts fresh.
+    Intended for application shutdown (e.g. FastAPI lifespan).
+    """
+    for factory in (get_sukl_client, get_biomcp_client):
+        if factory.cache_info().currsize == 0:
+            continue
+        client = factory()
+        factory.cache_clear()
+        if client is not None:
+            await client.close()
+
+
+def _document_key(doc: Document) -> tuple[Any, str]:
+    """Identity of a retrieved document for deduplication (source + content)."""
+    return doc.metadata.get("source"), doc.page_content
+
+
 def add_documents(
     existing: Sequence[Document],
     new: Sequence[Document],
@@ -126,16 +213,29 @@ def add_documents(
 
     Appends new documents to existing list instead of replacing.
     Used for parallel agent execution where multiple agents contribute
-    documents to state.retrieved_docs.
+    documents to state.retrieved_docs. Documents with the same source and
+    content as one already present are skipped, so repeated retrievals
+    do not bloat the synthesizer context.
 
     Args:
         existing: Current documents in state.
         new: New documents to append.
 
     Returns:
-        Combined list of documents.
+        Combined list of documents, without duplicates from ``new``.
     """
-    return list(existing) + list(new)
+    # Nothing to add (e.g. synthesizer): keep the current list, no copy needed
+    if not new and isinstance(existing, list):
+        return existing
+    # Never mutate `existing` (it may be shared with checkpoints)
+    combined = list(existing)
+    seen = {_document_key(doc) for doc in existing}
+    for doc in new:
+        key = _document_key(doc)
+        if key not in seen:
+            seen.add(key)
+            combined.append(doc)
+    return combined
 
 
 class Context(TypedDict, total=False):
@@ -193,7 +293,7 @@ class Context(TypedDict, total=False):
     mode: Literal["quick", "deep"]
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """Agent state passed between nodes.
 
@@ -218,116 +318,52 @@ class State:
     guideline_query: GuidelineQuery | None = None
 
 
-# Drug-related keywords for routing (Czech + English)
-DRUG_KEYWORDS = {
-    # Czech
-    "lék",
-    "léky",
-    "léčivo",
-    "léčiva",
-    "prášky",
-    "tablety",
-    "pilulky",
-    "složení",
-    "účinná látka",
-    "indikace",
-    "kontraindikace",
-    "dávkování",
-    "úhrada",
-    "cena",
-    "doplatek",
-    "dostupnost",
-    "alternativa",
-    "súkl",
-    "atc",
-    "registrační",
-    # English fallback
-    "drug",
-    "medicine",
-    "medication",
-    "pill",
-    "tablet",
-    "ingredient",
-    "dosage",
-    "reimbursement",
-    "availability",
-}
-
-# Research-related keywords for routing (Czech + English)
-RESEARCH_KEYWORDS = {
-    # Czech - research-SPECIFIC terms (must clearly indicate research intent)
-    "studie",
-    "výzkum",
-    "pubmed",
-    "článek",
-    "články",
-    "literatura",
-    "pmid",
-    "výzkumný",
-    "klinická studie",
-    "klinický výzkum",
-    "randomizovaná studie",
-    "meta-analýza",
-    "review",
-    "evidence",
-    "důkazy",
-    "publikace",
-    # English fallback - research specific
-    "study",
-    "research",
-    "article",
-    "literature",
-    "paper",
-    "clinical trial",
-    "meta-analysis",
-    "systematic review",
-    "publication",
-}
+# Agent node names returned by route_query()
+RouteName = Literal["drug_agent", "pubmed_agent", "guidelines_agent", "general_agent"]
+ROUTE_DRUG: Final = "drug_agent"
+ROUTE_PUBMED: Final = "pubmed_agent"
+ROUTE_GUIDELINES: Final = "guidelines_agent"
+ROUTE_GENERAL: Final = "general_agent"
 
-# Generic medical terms - these alone DON'T indicate research intent.
-# They're used by the LLM classifier (supervisor) for context, NOT keyword routing.
-# Moved OUT of RESEARCH_KEYWORDS to fix routing overlap:
-# "léčba", "léčení", "terapie", "onemocnění", "nemoc", "choroba",
-# "syndrom", "symptom", "příznaky", "diagnóza", "diagnostika",
-# "prevence", "prognóza", "komplikace", "riziko", "účinnost",
-# "bezpečnost", "diabetes", "diabetu", "cukrovka", etc.
-
-# Guidelines-related keywords for routing (Czech + English)
-GUIDELINES_KEYWORDS = {
-    # Czech
-    "guidelines",
-    "doporučené postupy",
-    "doporučení",
-    "standardy",
-    "standard",
-    "protokol",
-    "algoritmus",
-    "cls jep",
-    "cls-jep",
-    "esc",
-    "ers",
-    "léčebný postup",
-    "diagnostický postup",
-    "klinické doporučení",
-    # English fallback
-    "guideline",
-    "recommendation",
-    "protocol",
-    "algorithm",
-    "clinical practice",
+_CATEGORY_ROUTES: Final[dict[str, RouteName]] = {
+    "drug": ROUTE_DRUG,
+    "research": ROUTE_PUBMED,
+    "guidelines": ROUTE_GUIDELINES,
 }
 
 
-def route_query(
+def route_explicit_query(
     state: State,
-) -> Literal["drug_agent", "pubmed_agent", "guidelines_agent", "general_agent"]:
+) -> Literal["drug_agent", "pubmed_agent", "guidelines_agent", "supervisor"]:
+    """Route pre-classified queries straight to their agent.
+
+    Entry router of the graph: callers that set drug_query, research_query
+    or guideline_query skip the supervisor node entirely. Everything else
+    goes to the supervisor for intent classification.
+
+    Args:
+        state: Current agent state.
+
+    Returns:
+        Agent node name for an explicit query, otherwise "supervisor".
+    """
+    if state.drug_query is not None:
+        return ROUTE_DRUG
+    if state.research_query is not None:
+        return ROUTE_PUBMED
+    if state.guideline_query is not None:
+        return ROUTE_GUIDELINES
+    return "supervisor"
+
+
+def route_query(state: State) -> RouteName:
     """Route query to appropriate agent based on content.
 
     Simple keyword-based routing as fallback for supervisor LLM classification.
 
     Routing priority:
     1. Explicit queries (drug_query, research_query, guideline_query)
-    2. Keyword matching via fallback_to_keyword_routing() (Drug > Research > Guidelines > General)
+    2. Keyword matching via match_keyword_categories() (Drug > Research > Guidelines > General)
 
     Args:
         state: Current agent state with messages.
@@ -335,30 +371,23 @@ def route_query(
     Returns:
         Node name to route to: "drug_agent", "pubmed_agent", "guidelines_agent", or "general_agent".
     """
-    from agent.nodes.supervisor import fallback_to_keyword_routing
-
-    # Check if explicit drug_query is set
-    if state.drug_query is not None:
-        return "drug_agent"
-
-    # Check if explicit research_query is set
-    if state.research_query is not None:
-        return "pubmed_agent"
+    # Explicit queries (drug_query, research_query, guideline_query)
+    explicit_route = route_explicit_query(state)
+    if explicit_route != "supervisor":
+        return explicit_route
 
-    # Check if explicit guideline_query is set
-    if state.guideline_query is not None:
-        return "guidelines_agent"
-
-    # Keyword-based routing from last message
+    # Keyword-based routing from last message (same matcher and priority as
+    # fallback_to_keyword_routing, without building an IntentResult)
     if state.messages:
         last_message = state.messages[-1]
         content_text = extract_message_content(last_message)
         if content_text:
-            result = fallback_to_keyword_routing(content_text)
-            return result.agents_to_call[0]  # type: ignore[return-value]
+            categories = match_keyword_categories(normalize_keyword_text(content_text))
+            if categories:
+                return _CATEGORY_ROUTES[categories[0]]
 
     # Default to general agent for non-specific queries
-    return "general_agent"
+    return ROUTE_GENERAL
 
 
 async def _supervisor_with_command(
@@ -369,40 +398,75 @@ async def _supervisor_with_command(
     supervisor_node returns Send | list[Send] for unit-test convenience,
     but compiled LangGraph nodes must return dict or Command.
     """
-    result = await supervisor_node(state, runtime)
-    if isinstance(result, list):
-        return Command(goto=result)
-    elif isinstance(result, Send):
-        return Command(goto=[result])
-    return result
-
-
-# Build and compile graph with Send API routing
-graph = (
-    StateGraph(State, context_schema=Context)
-    # Add nodes
-    # Feature 007: Supervisor orchestrator (LLM-based intent classification + Send API)
-    .add_node("supervisor", _supervisor_with_command)
-    .add_node("general_agent", general_agent_node)
-    .add_node("drug_agent", drug_agent_node)
-    # Feature 005: PubMed research (internal CZ→EN translation)
-    .add_node("pubmed_agent", pubmed_agent_node)
-    # Feature 006: Guidelines Agent
-    .add_node("guidelines_agent", guidelines_agent_node)
-    # Feature 009: Synthesizer (combines multi-agent responses)
-    .add_node("synthesizer", synthesizer_node)
-    # Entry point
-    .add_edge("__start__", "supervisor")
-    # Supervisor uses Send API for dynamic routing (no conditional edges needed)
-    # Agent edges route to synthesizer (Feature 009)
-    .add_edge("drug_agent", "synthesizer")
-    # PubMed research: pubmed_agent handles CZ→EN internally
-    .add_edge("pubmed_agent", "synthesizer")
-    # Guidelines agent routes to synthesizer
-    .add_edge("guidelines_agent", "synthesizer")
-    # General agent routes to synthesizer
-    .add_edge("general_agent", "synthesizer")
-    # Synthesizer ends the graph
-    .add_edge("synthesizer", "__end__")
-    .compile(name="Czech MedAI")
-)
+    from agent.nodes.supervisor import supervisor_node
+
+    # Command accepts a single Send or a list of them, no type dispatch needed
+    return Command(goto=await supervisor_node(state, runtime))
+
+
+def build_graph() -> CompiledStateGraph[Any, Any, Any, Any]:
+    """Build and compile the Czech MedAI graph with Send API routing.
+
+    Node modules (LLM clients, MCP adapters, storage) are imported here rather
+    than at module import time, and .env / LangSmith tracing are initialized
+    on first build.
+
+    For batch evaluation, run many inputs concurrently with
+    ``await graph.abatch(inputs, config={"callbacks": None})`` instead of
+    looping over ``ainvoke``.
+
+    Returns:
+        Compiled graph named "Czech MedAI".
+    """
+    from agent.nodes.drug_agent import drug_agent_node
+    from agent.nodes.general_agent import general_agent_node
+    from agent.nodes.guidelines_agent import guidelines_agent_node
+    from agent.nodes.pubmed_agent import pubmed_agent_node
+    from agent.nodes.synthesizer import synthesizer_node
+
+    _init_environment()
+
+    return (
+        StateGraph(State, context_schema=Context)
+        # Add nodes
+        # Feature 007: Supervisor orchestrator (LLM-based intent classification + Send API)
+        .add_node("supervisor", _supervisor_with_command)
+        .add_node("general_agent", general_agent_node)
+        .add_node("drug_agent", drug_agent_node)
+        # Feature 005: PubMed research (internal CZ→EN translation)
+        .add_node("pubmed_agent", pubmed_agent_node)
+        # Feature 006: Guidelines Agent
+        .add_node("guidelines_agent", guidelines_agent_node)
+        # Feature 009: Synthesizer (combines multi-agent responses)
+        .add_node("synthesizer", synthesizer_node)
+        # Entry point: explicit queries skip the supervisor
+        .add_conditional_edges(
+            "__start__",
+            route_explicit_query,
+            [ROUTE_DRUG, ROUTE_PUBMED, ROUTE_GUIDELINES, "supervisor"],
+        )
+        # Supervisor uses Send API for dynamic routing (no conditional edges needed)
+        # Agent edges route to synthesizer (Feature 009)
+        .add_edge("drug_agent", "synthesizer")
+        # PubMed research: pubmed_agent handles CZ→EN internally
+        .add_edge("pubmed_agent", "synthesizer")
+        # Guidelines agent routes to synthesizer
+        .add_edge("guidelines_agent", "synthesizer")
+        # General agent routes to synthesizer
+        .add_edge("general_agent", "synthesizer")
+        # Synthesizer ends the graph
+        .add_edge("synthesizer", "__end__")
+        .compile(name="Czech MedAI")
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily build ``graph`` and resolve node exports on first access (PEP 562)."""
+    if name == "graph":
+        compiled = build_graph()
+        globals()["graph"] = compiled  # Cache: later lookups skip __getattr__
+        return compiled
+    if name in _LAZY_NODE_EXPORTS:
+        module = importlib.import_module(_LAZY_NODE_EXPORTS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -26,6 +26,7 @@ __version__ = "0.1.0"
 
 # Domain entities
 from .adapters.biomcp_client import BioMCPClient
+from .adapters.circuit_breaker import CircuitBreaker
 from .adapters.retry_strategy import TenacityRetryStrategy
 
 # Adapters (implementations)
@@ -42,6 +43,7 @@ from .domain.entities import (
 
 # Domain exceptions
 from .domain.exceptions import (
+    MCPCircuitOpenError,
     MCPConnectionError,
     MCPError,
     MCPServerError,
@@ -66,6 +68,7 @@ __all__ = [
     # Domain exceptions
     "MCPError",
     "MCPConnectionError",
+    "MCPCircuitOpenError",
     "MCPTimeoutError",
     "MCPValidationError",
     "MCPServerError",
@@ -73,6 +76,7 @@ __all__ = [
     "SUKLMCPClient",
     "BioMCPClient",
     "TenacityRetryStrategy",
+    "CircuitBreaker",
     # Configuration
     "MCPConfig",
 ]
@@ -10,24 +10,55 @@ Provides 24 tools, focusing on top 3:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
 import logging
-from datetime import datetime
-from typing import Any
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 import aiohttp
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from ..domain.entities import MCPHealthStatus, MCPResponse, MCPToolMetadata, RetryConfig
 from ..domain.exceptions import (
+    MCPCircuitOpenError,
     MCPConnectionError,
     MCPServerError,
     MCPTimeoutError,
     MCPValidationError,
 )
 from ..domain.ports import IMCPClient, IRetryStrategy
+from .circuit_breaker import CircuitBreaker
+from .connection_pool import (
+    CONNECTOR_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    create_connector,
+    get_shared_connector,
+)
+from .retry_strategy import RETRYABLE_SERVER_STATUS_CODES, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Default in-flight requests for the *_batch helpers (stays below the
+# connector's per-host limit, so batches never queue for a socket)
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Default bound on cached tool responses (see cache_ttl)
+DEFAULT_CACHE_SIZE = 256
+
+# Default bound on in-flight requests per client (bulkhead, see max_concurrency)
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Cap on error body bytes read into error messages
+ERROR_BODY_LIMIT = 64 * 1024
+
 
 # Pydantic models for BioMCP responses
 class PubMedArticle(BaseModel):
@@ -52,6 +83,54 @@ class ClinicalTrial(BaseModel):
     conditions: list[str] = Field(default_factory=list)
 
 
+# Validate whole result lists in one pydantic-core call
+_ARTICLES_ADAPTER = TypeAdapter(list[PubMedArticle])
+_TRIALS_ADAPTER = TypeAdapter(list[ClinicalTrial])
+
+
+async def _read_error_body(
+    response: aiohttp.ClientResponse, limit: int = ERROR_BODY_LIMIT
+) -> str:
+    """Read at most `limit` bytes of an error response body.
+
+    The unread remainder is dropped with the connection, so a huge error
+    page cannot tie up the client.
+
+    Args:
+        response: Non-2xx response.
+        limit: Maximum bytes to read.
+
+    Returns:
+        Decoded (possibly truncated) body text.
+    """
+    body = await response.content.read(limit)
+    return body.decode(response.charset or "utf-8", errors="replace")
+
+
+# Static tool metadata returned by list_tools
+_BIOMCP_TOOLS: tuple[MCPToolMetadata, ...] = (
+    MCPToolMetadata(
+        name="article_searcher",
+        description="Search PubMed, bioRxiv, and other databases",
+        parameters={"query": "string", "max_results": "int"},
+        returns={"articles": "list[PubMedArticle]"},
+    ),
+    MCPToolMetadata(
+        name="get_article_full_text",
+        description="Get full article text or open access URL",
+        parameters={"pmid": "string"},
+        returns={"full_text": "string", "url": "string"},
+    ),
+    MCPToolMetadata(
+        name="search_clinical_trials",
+        description="Search ClinicalTrials.gov database",
+        parameters={"query": "string"},
+        returns={"trials": "list[ClinicalTrial]"},
+    ),
+    # ... 21 more tools not shown for brevity
+)
+
+
 class BioMCPClient(IMCPClient):
     """Adapter: BioMCP server client.
 
@@ -64,6 +143,10 @@ class BioMCPClient(IMCPClient):
         retry_strategy: Optional retry implementation.
         default_retry_config: Default RetryConfig with longer delays.
 
+    Supports async context manager for safe resource cleanup:
+        async with BioMCPClient() as client:
+            articles = await client.search_articles("diabetes treatment")
+
     Example:
         >>> client = BioMCPClient(base_url="http://localhost:8080")
         >>> articles = await client.search_articles("diabetes treatment")
@@ -77,6 +160,14 @@ class BioMCPClient(IMCPClient):
         max_results: int = 10,
         retry_strategy: IRetryStrategy | None = None,
         default_retry_config: RetryConfig | None = None,
+        share_connector: bool = False,
+        connector_limit_per_host: int = CONNECTOR_LIMIT_PER_HOST,
+        dns_cache_ttl: int = DNS_CACHE_TTL,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+        cache_ttl: float | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize BioMCPClient.
 
@@ -86,7 +177,28 @@ class BioMCPClient(IMCPClient):
             max_results: Default maximum results for searches.
             retry_strategy: Optional retry strategy (injected dependency).
             default_retry_config: Default retry configuration.
+            share_connector: Open the session on the shared connection pool
+                (see connection_pool) instead of a client-owned one.
+            connector_limit_per_host: Connection cap to the BioMCP server
+                (client-owned pool only).
+            dns_cache_ttl: Seconds resolved addresses are cached
+                (client-owned pool only).
+            keepalive_timeout: Seconds idle connections are kept for reuse
+                (client-owned pool only).
+            cache_ttl: Seconds successful tool responses are cached per
+                (tool, parameters); None or 0 disables caching.
+            cache_size: Maximum cached responses (least recently used evicted).
+            circuit_breaker: Optional breaker that fails calls fast while the
+                server keeps returning connection or 5xx errors.
+            max_concurrency: Maximum in-flight requests to BioMCP; keep it at
+                or below connector_limit_per_host so waiting callers queue
+                here rather than for a socket.
+
+        Raises:
+            ValueError: If max_concurrency < 1.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         self.base_url = base_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_results = max_results
@@ -95,33 +207,109 @@ class BioMCPClient(IMCPClient):
             max_retries=3,
             base_delay=2.0,  # BioMCP slower, longer delays
         )
+        self.share_connector = share_connector
+        self.connector_limit_per_host = connector_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.circuit_breaker = circuit_breaker
+        self.max_concurrency = max_concurrency
+        self._bulkhead = asyncio.Semaphore(max_concurrency)
         self._session: aiohttp.ClientSession | None = None
+        # (tool, canonical params JSON) -> (expires_at, response)
+        self._response_cache: OrderedDict[str, tuple[float, MCPResponse]] = (
+            OrderedDict()
+        )
+
+        logger.info("[BioMCPClient] Initialized with base_url=%s", base_url)
 
-        logger.info(f"[BioMCPClient] Initialized with base_url={base_url}")
+    async def __aenter__(self) -> BioMCPClient:
+        """Open the HTTP session up front; closed again on exit."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Close the HTTP session."""
+        await self.close()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session (lazy initialization).
 
+        The check and creation contain no await, so concurrent callers on
+        one event loop cannot create duplicate sessions and no lock is needed.
+
         Returns:
             Active aiohttp.ClientSession.
         """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            if self.share_connector:
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=get_shared_connector(),
+                    connector_owner=False,
+                )
+            else:
+                # Client-owned keep-alive pool with DNS cache: repeated tool
+                # calls reuse connections instead of reconnecting
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=create_connector(
+                        limit_per_host=self.connector_limit_per_host,
+                        keepalive_timeout=self.keepalive_timeout,
+                        ttl_dns_cache=self.dns_cache_ttl,
+                    ),
+                )
             logger.debug("[BioMCPClient] Created new aiohttp session")
         return self._session
 
+    def _cache_get(self, key: str) -> MCPResponse | None:
+        """Return a copy of a cached response, or None on miss or expiry.
+
+        Callers get their own deep copy, so editing the article list or
+        metadata cannot change what later cache hits return.
+        """
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return copy.deepcopy(response)
+
+    def _cache_set(self, key: str, response: MCPResponse, ttl: float) -> None:
+        """Store a copy of a response, evicting the least recently used if full."""
+        self._response_cache[key] = (time.monotonic() + ttl, copy.deepcopy(response))
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
+
     async def call_tool(
         self,
         tool_name: str,
         parameters: dict[str, Any],
         retry_config: RetryConfig | None = None,
+        cache_bypass: bool = False,
     ) -> MCPResponse:
         """Call BioMCP tool with parameters.
 
+        With cache_ttl set, successful responses are served from an
+        in-process cache for identical (tool, parameters) calls. Only
+        JSON-serializable parameters are cached; each hit is a fresh copy.
+
         Args:
             tool_name: Tool identifier (e.g., "article_searcher").
             parameters: Tool parameters.
             retry_config: Override default retry config.
+            cache_bypass: Skip the cache lookup and always call the server
+                (the fresh response still refreshes the cache).
 
         Returns:
             MCPResponse with success/failure and data.
@@ -133,59 +321,84 @@ class BioMCPClient(IMCPClient):
         """
         config = retry_config or self.default_retry_config
 
+        cache_key = None
+        if self.cache_ttl:
+            try:
+                cache_key = f"{tool_name}\0" + json.dumps(parameters, sort_keys=True)
+            except (TypeError, ValueError):
+                # Not plain JSON: no canonical key, so skip the cache
+                logger.debug(
+                    "[BioMCPClient] Parameters for %s not cacheable", tool_name
+                )
+            if cache_key is not None and not cache_bypass:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    logger.debug("[BioMCPClient] Cache hit for %s", tool_name)
+                    return cached
+
+        breaker = self.circuit_breaker
+
         async def _execute() -> MCPResponse:
             """Inner function for retry wrapper."""
             session = await self._get_session()
             url = f"{self.base_url}/tools/{tool_name}"
 
-            start_time = datetime.now()
-
             try:
-                logger.debug(f"[BioMCPClient] Calling {tool_name} with {parameters}")
+                # Bulkhead: wait for a slot before timing or sending the call
+                async with self._bulkhead:
+                    start_time = time.perf_counter()
 
-                async with session.post(url, json=parameters) as response:
-                    latency_ms = int(
-                        (datetime.now() - start_time).total_seconds() * 1000
+                    logger.debug(
+                        "[BioMCPClient] Calling %s with %s", tool_name, parameters
                     )
 
-                    # Handle server errors (5xx)
-                    if response.status >= 500:
-                        error_text = await response.text()
-                        raise MCPServerError(
-                            f"BioMCP server error: {response.status} - {error_text}",
-                            status_code=response.status,
-                        )
-
-                    # Handle rate limiting (429)
-                    if response.status == 429:
-                        retry_after = response.headers.get("Retry-After", "60")
-                        raise MCPTimeoutError(
-                            f"Rate limited, retry after {retry_after}s",
-                            server_url=self.base_url,
-                        )
+                    async with session.post(url, json=parameters) as response:
+                        latency_ms = int((time.perf_counter() - start_time) * 1000)
+
+                        # Handle server errors (5xx)
+                        if response.status >= 500:
+                            error_text = await _read_error_body(response)
+                            raise MCPServerError(
+                                f"BioMCP server error: {response.status} - {error_text}",
+                                status_code=response.status,
+                            )
+
+                        # Handle rate limiting (429)
+                        if response.status == 429:
+                            retry_after = parse_retry_after(
+                                response.headers.get("Retry-After")
+                            )
+                            raise MCPTimeoutError(
+                                f"Rate limited, retry after {retry_after}s"
+                                if retry_after is not None
+                                else "Rate limited",
+                                server_url=self.base_url,
+                                retry_after=retry_after,
+                            )
+
+                        # Handle client errors (4xx)
+                        if response.status >= 400:
+                            error_text = await _read_error_body(response)
+                            return MCPResponse(
+                                success=False,
+                                error=f"HTTP {response.status}: {error_text}",
+                                metadata={"latency_ms": latency_ms},
+                            )
+
+                        # Success - parse JSON response with pydantic-core's Rust
+                        # parser (faster than stdlib json on long article lists)
+                        data = from_json(await response.read())
 
-                    # Handle client errors (4xx)
-                    if response.status >= 400:
-                        error_text = await response.text()
                         return MCPResponse(
-                            success=False,
-                            error=f"HTTP {response.status}: {error_text}",
-                            metadata={"latency_ms": latency_ms},
+                            success=True,
+                            data=data,
+                            metadata={
+                                "latency_ms": latency_ms,
+                                "server_url": self.base_url,
+                                "tool_name": tool_name,
+                            },
                         )
 
-                    # Success - parse JSON response
-                    data = await response.json()
-
-                    return MCPResponse(
-                        success=True,
-                        data=data,
-                        metadata={
-                            "latency_ms": latency_ms,
-                            "server_url": self.base_url,
-                            "tool_name": tool_name,
-                        },
-                    )
-
             except aiohttp.ClientConnectorError as e:
                 raise MCPConnectionError(
                     f"Cannot connect to BioMCP server at {self.base_url}",
@@ -203,14 +416,46 @@ class BioMCPClient(IMCPClient):
                     "Invalid BioMCP response schema", validation_errors=e.errors()
                 ) from e
 
+        async def _attempt() -> MCPResponse:
+            """Run one request, reporting its outcome to the circuit breaker.
+
+            Checked on every attempt, so retries stop as soon as the circuit
+            opens. Only connection errors and transient 5xx count as
+            failures; other server errors still prove the server responds.
+            """
+            if breaker is None:
+                return await _execute()
+            # Open circuit: fail fast, without connect timeouts or backoff
+            if not breaker.allow_request():
+                raise MCPCircuitOpenError(
+                    f"BioMCP circuit open, not calling {tool_name}",
+                    server_url=self.base_url,
+                )
+            try:
+                response = await _execute()
+            except MCPConnectionError:
+                breaker.record_failure()
+                raise
+            except MCPServerError as e:
+                if e.status_code in RETRYABLE_SERVER_STATUS_CODES:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                raise
+            breaker.record_success()
+            return response
+
         # Execute with retry if strategy provided
         if self.retry_strategy:
             result: MCPResponse = await self.retry_strategy.execute_with_retry(
-                _execute, config
+                _attempt, config
             )
-            return result
         else:
-            return await _execute()
+            result = await _attempt()
+
+        if cache_key is not None and self.cache_ttl and result.success:
+            self._cache_set(cache_key, result, self.cache_ttl)
+        return result
 
     async def health_check(self, timeout: float = 5.0) -> MCPHealthStatus:
         """Check BioMCP Docker container health.
@@ -226,12 +471,12 @@ class BioMCPClient(IMCPClient):
         """
         try:
             session = await self._get_session()
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             async with session.get(
                 f"{self.base_url}/health", timeout=aiohttp.ClientTimeout(total=timeout)
             ) as response:
-                latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                latency_ms = int((time.perf_counter() - start_time) * 1000)
 
                 if response.status == 200:
                     data = await response.json()
@@ -241,7 +486,7 @@ class BioMCPClient(IMCPClient):
                         tools_count=data.get("tools_count", 24),
                     )
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_body(response)
                     return MCPHealthStatus(
                         status="unhealthy",
                         latency_ms=latency_ms,
@@ -268,27 +513,7 @@ class BioMCPClient(IMCPClient):
         Note:
             Currently returns hardcoded list. Future: query /tools endpoint.
         """
-        return [
-            MCPToolMetadata(
-                name="article_searcher",
-                description="Search PubMed, bioRxiv, and other databases",
-                parameters={"query": "string", "max_results": "int"},
-                returns={"articles": "list[PubMedArticle]"},
-            ),
-            MCPToolMetadata(
-                name="get_article_full_text",
-                description="Get full article text or open access URL",
-                parameters={"pmid": "string"},
-                returns={"full_text": "string", "url": "string"},
-            ),
-            MCPToolMetadata(
-                name="search_clinical_trials",
-                description="Search ClinicalTrials.gov database",
-                parameters={"query": "string"},
-                returns={"trials": "list[ClinicalTrial]"},
-            ),
-            # ... 21 more tools not shown for brevity
-        ]
+        return list(_BIOMCP_TOOLS)
 
     async def close(self) -> None:
         """Close aiohttp session gracefully."""
@@ -324,10 +549,7 @@ class BioMCPClient(IMCPClient):
 
         # Validate with Pydantic
         try:
-            return [
-                PubMedArticle(**article)
-                for article in response.data.get("articles", [])
-            ]
+            return _ARTICLES_ADAPTER.validate_python(response.data.get("articles", []))
         except ValidationError as e:
             raise MCPValidationError(
                 "Invalid article search response", validation_errors=e.errors()
@@ -375,8 +597,98 @@ class BioMCPClient(IMCPClient):
 
         # Validate with Pydantic
         try:
-            return [ClinicalTrial(**trial) for trial in response.data.get("trials", [])]
+            return _TRIALS_ADAPTER.validate_python(response.data.get("trials", []))
         except ValidationError as e:
             raise MCPValidationError(
                 "Invalid trial search response", validation_errors=e.errors()
             ) from e
+
+    # Batch helpers (concurrent requests over the keep-alive pool)
+
+    async def _gather_limited(
+        self,
+        func: Callable[[str], Awaitable[_T]],
+        args: list[str],
+        concurrency: int,
+    ) -> list[_T | BaseException]:
+        """Run func over args concurrently with at most `concurrency` in flight."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(arg: str) -> _T:
+            async with semaphore:
+                return await func(arg)
+
+        return await asyncio.gather(
+            *(_one(arg) for arg in args), return_exceptions=True
+        )
+
+    async def search_articles_batch(
+        self,
+        queries: list[str],
+        max_results: int | None = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[list[PubMedArticle] | BaseException]:
+        """Search PubMed for several queries concurrently.
+
+        Keep `concurrency` at or below the connector's per-host limit so
+        requests do not queue waiting for a pooled connection.
+
+        Args:
+            queries: Search queries.
+            max_results: Limit results per query (default: self.max_results).
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            Per-query article lists in input order; a failed query yields its
+            exception instead of raising.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+
+        async def _search(query: str) -> list[PubMedArticle]:
+            return await self.search_articles(query, max_results)
+
+        return await self._gather_limited(_search, queries, concurrency)
+
+    async def search_trials_batch(
+        self,
+        queries: list[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[list[ClinicalTrial] | BaseException]:
+        """Search clinical trials for several queries concurrently.
+
+        Args:
+            queries: Search queries.
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            Per-query trial lists in input order; a failed query yields its
+            exception instead of raising.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        return await self._gather_limited(self.search_trials, queries, concurrency)
+
+    async def get_full_text_batch(
+        self,
+        pmids: list[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[str | None | BaseException]:
+        """Get full text or URL for several articles concurrently.
+
+        Args:
+            pmids: PubMed IDs.
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            Per-PMID full text, URL or None in input order; a failed request
+            yields its exception instead of raising.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        return await self._gather_limited(self.get_full_text, pmids, concurrency)
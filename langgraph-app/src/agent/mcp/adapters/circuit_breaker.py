@@ -0,0 +1,84 @@
+"""Circuit breaker for MCP clients.
+
+Stops calling an MCP server that keeps failing: after `fail_threshold`
+consecutive connection/server errors the circuit opens and calls fail fast
+instead of waiting for connect timeouts and retry backoff. Once
+`recovery_timeout` has passed, a single probe call is let through; its
+success closes the circuit, its failure keeps it open for another period.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (CLOSED -> OPEN -> HALF_OPEN).
+
+    Example:
+        >>> breaker = CircuitBreaker(fail_threshold=5, recovery_timeout=30.0)
+        >>> if breaker.allow_request():
+        ...     ...  # call the server, then record_success()/record_failure()
+    """
+
+    def __init__(self, fail_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Initialize the breaker in the closed state.
+
+        Args:
+            fail_threshold: Consecutive failures that open the circuit.
+            recovery_timeout: Seconds to wait before letting a probe through.
+
+        Raises:
+            ValueError: If fail_threshold < 1 or recovery_timeout <= 0.
+        """
+        if fail_threshold < 1 or recovery_timeout <= 0:
+            raise ValueError(
+                "fail_threshold must be >= 1 and recovery_timeout positive"
+            )
+        self.fail_threshold = fail_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        """Current circuit state."""
+        if self.failure_count < self.fail_threshold:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.recovery_timeout:
+            return "half_open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        """Return whether a call may proceed.
+
+        In the half-open state one probe is allowed and the recovery timer
+        restarts, so concurrent callers keep failing fast until the probe
+        reports back (or another recovery_timeout passes).
+        """
+        state = self.state
+        if state == "half_open":
+            self.opened_at = time.monotonic()
+            logger.info("[CircuitBreaker] Half-open: allowing probe request")
+            return True
+        return state == "closed"
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self.failure_count >= self.fail_threshold:
+            logger.info("[CircuitBreaker] Closed after successful probe")
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failure_count += 1
+        if self.failure_count >= self.fail_threshold:
+            self.opened_at = time.monotonic()
+            logger.warning(
+                "[CircuitBreaker] Open after %d consecutive failures",
+                self.failure_count,
+            )
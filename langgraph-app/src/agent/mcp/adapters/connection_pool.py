@@ -0,0 +1,85 @@
+"""Shared aiohttp connection pool for MCP adapters.
+
+Clients created with ``share_connector=True`` open their sessions on one
+TCPConnector instead of each owning a pool, so concurrent tool calls across
+SÚKL and BioMCP share keep-alive connections and a DNS cache under a single
+connection cap.
+
+aiohttp connectors are bound to the event loop that created them, so one
+connector is kept per running loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+CONNECTOR_LIMIT = 200
+CONNECTOR_LIMIT_PER_HOST = 50
+KEEPALIVE_TIMEOUT = 30.0
+DNS_CACHE_TTL = 300
+
+_connectors: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.TCPConnector
+] = weakref.WeakKeyDictionary()
+
+
+def create_connector(
+    limit: int = CONNECTOR_LIMIT,
+    limit_per_host: int = CONNECTOR_LIMIT_PER_HOST,
+    keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ttl_dns_cache: int = DNS_CACHE_TTL,
+) -> aiohttp.TCPConnector:
+    """Create a TCPConnector with tuned keep-alive and connection limits.
+
+    Must be called inside a running event loop.
+
+    Args:
+        limit: Total connection cap.
+        limit_per_host: Connection cap per (host, port).
+        keepalive_timeout: Seconds an idle connection stays in the pool.
+        ttl_dns_cache: Seconds resolved addresses are cached.
+
+    Returns:
+        New TCPConnector (owned by the caller).
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the shared connector for the running event loop.
+
+    Sessions using it must be created with ``connector_owner=False`` so that
+    closing a session leaves the pool open for other clients.
+
+    Returns:
+        TCPConnector with tuned keep-alive and connection limits.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = create_connector()
+        _connectors[loop] = connector
+        logger.debug("[connection_pool] Created shared TCPConnector")
+    return connector
+
+
+async def close_shared_connector() -> None:
+    """Close the shared connector of the running event loop, if any."""
+    connector = _connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None and not connector.closed:
+        await connector.close()
+        logger.info("[connection_pool] Shared TCPConnector closed")
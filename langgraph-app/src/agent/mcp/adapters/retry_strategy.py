@@ -1,6 +1,6 @@
 """Retry strategy adapter using Tenacity library.
 
-Implements IRetryStrategy with exponential backoff and jitter
+Implements IRetryStrategy with exponential backoff and full jitter
 for resilient MCP operations.
 
 Following Constitution:
@@ -11,26 +11,79 @@ Following Constitution:
 
 from __future__ import annotations
 
+import inspect
 import logging
-import random
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any, Awaitable, Callable, Union
 
 from tenacity import (
-    RetryError,
+    AsyncRetrying,
+    RetryCallState,
     before_sleep_log,
-    retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
+    wait_random_exponential,
 )
 from tenacity.wait import wait_base
 
 from ..domain.entities import RetryConfig
-from ..domain.exceptions import MCPConnectionError, MCPServerError, MCPTimeoutError
+from ..domain.exceptions import (
+    MCPCircuitOpenError,
+    MCPConnectionError,
+    MCPServerError,
+    MCPTimeoutError,
+)
 from ..domain.ports import IRetryStrategy
 
 logger = logging.getLogger(__name__)
 
+# Server errors worth retrying; others (501, 505, ...) will not recover
+RETRYABLE_SERVER_STATUS_CODES = frozenset({500, 502, 503, 504, 507, 508})
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Return whether a failed MCP operation should be retried.
+
+    Args:
+        exc: Exception raised by the operation.
+
+    Returns:
+        True for connection errors (except an open circuit), timeouts/rate
+        limits and transient 5xx.
+    """
+    if isinstance(exc, MCPCircuitOpenError):
+        return False
+    if isinstance(exc, (MCPConnectionError, MCPTimeoutError)):
+        return True
+    return (
+        isinstance(exc, MCPServerError)
+        and exc.status_code in RETRYABLE_SERVER_STATUS_CODES
+    )
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse an HTTP Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date.
+
+    Returns:
+        Non-negative delay in seconds, or None if missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
 
 class TenacityRetryStrategy(IRetryStrategy):
     """Adapter: Retry strategy using Tenacity.
@@ -38,11 +91,12 @@ class TenacityRetryStrategy(IRetryStrategy):
     Implements exponential backoff with optional jitter for:
     - MCPConnectionError (transient network issues)
     - MCPTimeoutError (including rate limiting 429)
-    - MCPServerError (5xx errors)
+    - MCPServerError with a transient status (500, 502-504, 507, 508)
 
     Does NOT retry:
     - MCPValidationError (client-side error, permanent)
     - 4xx errors except 429 (client error, won't fix)
+    - Permanent 5xx such as 501 Not Implemented or 505
     - Generic exceptions (unexpected errors)
 
     Example:
@@ -53,6 +107,9 @@ class TenacityRetryStrategy(IRetryStrategy):
 
     def __init__(self) -> None:
         """Initialize retry strategy."""
+        # Retry engines memoized per RetryConfig values; each call runs on a
+        # copy, since an AsyncRetrying holds per-run state.
+        self._engines: dict[tuple[int, float, float, int, bool], AsyncRetrying] = {}
         logger.info("[TenacityRetryStrategy] Initialized")
 
     async def execute_with_retry(
@@ -75,60 +132,82 @@ class TenacityRetryStrategy(IRetryStrategy):
         Raises:
             Original exception after max_retries exhausted.
         """
-        # Build Tenacity retry decorator dynamically
-        retry_decorator = retry(
-            stop=stop_after_attempt(config.max_retries + 1),  # +1 for initial attempt
-            wait=self._build_wait_strategy(config),
-            retry=retry_if_exception_type(
-                (
-                    MCPConnectionError,
-                    MCPTimeoutError,
-                    MCPServerError,
-                )
-            ),
-            before_sleep=before_sleep_log(logger, logging.WARNING),
-            reraise=True,
-        )
+        # The engine is built with reraise=True, so exhausted retries raise
+        # the operation's own exception rather than tenacity's RetryError
+        async for attempt in self._get_engine(config).copy():
+            with attempt:
+                result = operation()
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+        # Not reached (each attempt returns or raises); fail loudly rather
+        # than return None if tenacity ever stops without an attempt
+        raise RuntimeError("Retry loop ended without an attempt")
+
+    def _get_engine(self, config: RetryConfig) -> AsyncRetrying:
+        """Return the memoized retry engine for a configuration.
 
-        # Apply decorator to operation
-        retryable_operation = retry_decorator(operation)
+        Args:
+            config: Retry configuration.
 
-        try:
-            return await retryable_operation()
-        except RetryError as e:
-            # Tenacity wraps exception, unwrap for clean error
-            original_exc = e.last_attempt.exception()
-            if original_exc is not None:
-                raise original_exc from e
-            raise
+        Returns:
+            AsyncRetrying template (copy it before iterating).
+        """
+        key = (
+            config.max_retries,
+            config.base_delay,
+            config.max_delay,
+            config.exponential_base,
+            config.jitter,
+        )
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = AsyncRetrying(
+                stop=stop_after_attempt(config.max_retries + 1),  # +1 initial
+                wait=self._build_wait_strategy(config),
+                retry=retry_if_exception(is_retryable_error),
+                before_sleep=before_sleep_log(logger, logging.WARNING),
+                reraise=True,
+            )
+            self._engines[key] = engine
+        return engine
 
     def _build_wait_strategy(
         self, config: RetryConfig
-    ) -> Union[wait_base, Callable[[Any], float]]:
+    ) -> Callable[[RetryCallState], float]:
         """Build Tenacity wait strategy with optional jitter.
 
+        With jitter, each wait is drawn uniformly from zero up to the
+        exponential delay ("full jitter"), which spreads out retries from
+        concurrent callers better than a fixed band around the delay.
+        A rate-limit error carrying retry_after waits that long instead
+        (capped at max_delay).
+
         Args:
             config: RetryConfig with base_delay, max_delay, jitter, exponential_base.
 
         Returns:
-            Tenacity wait strategy function.
+            Tenacity wait strategy.
         """
-        base_wait = wait_exponential(
-            multiplier=config.base_delay,
-            max=config.max_delay,
-            exp_base=config.exponential_base,
-        )
-
+        backoff: wait_base
         if config.jitter:
-            # Add jitter: random ±20% of calculated delay
-            def wait_with_jitter(retry_state: Any) -> float:
-                delay = base_wait(retry_state)
-                # Ensure delay is a float
-                delay_float = float(delay) if delay is not None else 0.0
-                # Add ±20% jitter
-                jitter_amount = delay_float * 0.2 * (random.random() * 2 - 1)
-                return max(0.0, delay_float + jitter_amount)
-
-            return wait_with_jitter
+            backoff = wait_random_exponential(
+                multiplier=config.base_delay,
+                max=config.max_delay,
+                exp_base=config.exponential_base,
+            )
         else:
-            return base_wait
+            backoff = wait_exponential(
+                multiplier=config.base_delay,
+                max=config.max_delay,
+                exp_base=config.exponential_base,
+            )
+
+        def wait_retry_after_or_backoff(retry_state: RetryCallState) -> float:
+            outcome = retry_state.outcome
+            exc = outcome.exception() if outcome is not None else None
+            if isinstance(exc, MCPTimeoutError) and exc.retry_after is not None:
+                return min(exc.retry_after, config.max_delay)
+            return float(backoff(retry_state))
+
+        return wait_retry_after_or_backoff
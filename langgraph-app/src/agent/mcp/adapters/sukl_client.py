@@ -25,7 +25,7 @@ import json
 import logging
 import os
 import re
-from datetime import datetime
+import time
 from typing import Any, cast
 
 import aiohttp
@@ -39,6 +39,8 @@ from ..domain.exceptions import (
     MCPValidationError,
 )
 from ..domain.ports import IMCPClient, IRetryStrategy
+from .connection_pool import get_shared_connector
+from .retry_strategy import parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -123,16 +125,18 @@ class SUKLMCPClient(IMCPClient):
         timeout: float = 30.0,
         retry_strategy: IRetryStrategy | None = None,
         default_retry_config: RetryConfig | None = None,
+        share_connector: bool = False,
     ):
         raw_url: str = base_url or os.getenv("SUKL_MCP_URL") or "http://localhost:3000"
         self.base_url = raw_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.retry_strategy = retry_strategy
         self.default_retry_config = default_retry_config or RetryConfig()
+        self.share_connector = share_connector
         self._session: aiohttp.ClientSession | None = None
         self._id_counter = itertools.count(1)
 
-        logger.info(f"[SUKLMCPClient] Initialized with base_url={self.base_url}")
+        logger.info("[SUKLMCPClient] Initialized with base_url=%s", self.base_url)
 
     async def __aenter__(self) -> SUKLMCPClient:
         return self
@@ -164,7 +168,14 @@ class SUKLMCPClient(IMCPClient):
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            if self.share_connector:
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=get_shared_connector(),
+                    connector_owner=False,
+                )
+            else:
+                self._session = aiohttp.ClientSession(timeout=self.timeout)
         return self._session
 
     def _map_tool_and_params(
@@ -220,11 +231,11 @@ class SUKLMCPClient(IMCPClient):
                 },
             )
 
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             try:
                 logger.debug(
-                    f"[SUKLMCPClient] JSON-RPC call: {mcp_tool} with {mcp_params}"
+                    "[SUKLMCPClient] JSON-RPC call: %s with %s", mcp_tool, mcp_params
                 )
 
                 async with session.post(
@@ -232,9 +243,7 @@ class SUKLMCPClient(IMCPClient):
                     json=payload,
                     headers=_RPC_HEADERS,
                 ) as response:
-                    latency_ms = int(
-                        (datetime.now() - start_time).total_seconds() * 1000
-                    )
+                    latency_ms = int((time.perf_counter() - start_time) * 1000)
 
                     if response.status >= 500:
                         error_text = await response.text()
@@ -244,10 +253,15 @@ class SUKLMCPClient(IMCPClient):
                         )
 
                     if response.status == 429:
-                        retry_after = response.headers.get("Retry-After", "60")
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
                         raise MCPTimeoutError(
-                            f"Rate limited, retry after {retry_after}s",
+                            f"Rate limited, retry after {retry_after}s"
+                            if retry_after is not None
+                            else "Rate limited",
                             server_url=self.base_url,
+                            retry_after=retry_after,
                         )
 
                     if response.status >= 400:
@@ -379,7 +393,7 @@ class SUKLMCPClient(IMCPClient):
         """Check SÚKL server health via JSON-RPC tools/list."""
         try:
             session = await self._get_session()
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             payload = self._build_rpc_request("tools/list")
 
@@ -389,7 +403,7 @@ class SUKLMCPClient(IMCPClient):
                 headers=_RPC_HEADERS,
                 timeout=aiohttp.ClientTimeout(total=timeout),
             ) as response:
-                latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                latency_ms = int((time.perf_counter() - start_time) * 1000)
 
                 if response.status == 200:
                     data = await response.json()
@@ -441,7 +455,7 @@ class SUKLMCPClient(IMCPClient):
                         for t in tools
                     ]
         except Exception as e:
-            logger.warning(f"[SUKLMCPClient] Failed to list tools: {e}")
+            logger.warning("[SUKLMCPClient] Failed to list tools: %s", e)
 
         # Fallback: hardcoded list
         return [
@@ -39,6 +39,7 @@ class MCPConfig:
         biomcp_url: BioMCP server URL.
         biomcp_timeout: BioMCP request timeout in seconds.
         biomcp_max_results: Default max results for BioMCP searches.
+        biomcp_cache_ttl: Seconds BioMCP tool responses are cached (0 disables).
         max_retries: Maximum retry attempts for transient errors.
         retry_base_delay: Initial retry delay in seconds.
         retry_max_delay: Maximum retry delay cap in seconds.
@@ -58,6 +59,7 @@ class MCPConfig:
     biomcp_url: str
     biomcp_timeout: float
     biomcp_max_results: int
+    biomcp_cache_ttl: float
 
     # Retry configuration
     max_retries: int
@@ -90,6 +92,7 @@ class MCPConfig:
             biomcp_url=os.getenv("BIOMCP_URL", "http://localhost:8080"),
             biomcp_timeout=float(os.getenv("BIOMCP_TIMEOUT", "60.0")),
             biomcp_max_results=int(os.getenv("BIOMCP_MAX_RESULTS", "10")),
+            biomcp_cache_ttl=float(os.getenv("BIOMCP_CACHE_TTL", "300")),
             # Retry configuration
             max_retries=int(os.getenv("MCP_MAX_RETRIES", "3")),
             retry_base_delay=float(os.getenv("MCP_RETRY_BASE_DELAY", "1.0")),
@@ -3,6 +3,7 @@
 Hierarchy:
 - MCPError (base)
   ├── MCPConnectionError (network/connection failures)
+  │   └── MCPCircuitOpenError (call skipped by an open circuit breaker)
   ├── MCPTimeoutError (timeout including rate limiting)
   ├── MCPValidationError (schema/parameter validation)
   └── MCPServerError (server-side 5xx errors)
@@ -50,6 +51,17 @@ class MCPConnectionError(MCPError):
     pass
 
 
+class MCPCircuitOpenError(MCPConnectionError):
+    """Call skipped because the client's circuit breaker is open.
+
+    A connection error for callers (the server is treated as unavailable),
+    but should NOT be retried: retrying would only hit the open circuit
+    again until its recovery timeout passes.
+    """
+
+    pass
+
+
 class MCPTimeoutError(MCPError):
     """MCP request exceeded timeout.
 
@@ -58,9 +70,27 @@ class MCPTimeoutError(MCPError):
     - Rate limiting (HTTP 429) encountered
 
     Should trigger retry with exponential backoff.
+
+    Attributes:
+        message: Error message.
+        retry_after: Seconds the server asked to wait (429 Retry-After), if any.
     """
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        server_url: str | None = None,
+        retry_after: float | None = None,
+    ):
+        """Initialize timeout error.
+
+        Args:
+            message: Error description.
+            server_url: Optional URL of MCP server where error occurred.
+            retry_after: Optional server-requested delay in seconds.
+        """
+        super().__init__(message, server_url=server_url)
+        self.retry_after = retry_after
 
 
 class MCPValidationError(MCPError):
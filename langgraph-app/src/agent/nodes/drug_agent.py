@@ -436,7 +436,7 @@ async def _search_drugs(client: SUKLMCPClient, query: DrugQuery) -> list[DrugRes
     Raises:
         MCPConnectionError, MCPTimeoutError, MCPServerError: On MCP failures.
     """
-    logger.debug(f"[drug_agent] Searching drugs: {query.query_text}")
+    logger.debug("[drug_agent] Searching drugs: %s", query.query_text)
 
     response = await client.call_tool(
         "search_drugs",
@@ -444,7 +444,7 @@ async def _search_drugs(client: SUKLMCPClient, query: DrugQuery) -> list[DrugRes
     )
 
     if not response.success:
-        logger.warning(f"[drug_agent] Search failed: {response.error}")
+        logger.warning("[drug_agent] Search failed: %s", response.error)
         return []
 
     results = []
@@ -453,7 +453,7 @@ async def _search_drugs(client: SUKLMCPClient, query: DrugQuery) -> list[DrugRes
         if result is not None:
             results.append(result)
 
-    logger.info(f"[drug_agent] Found {len(results)} drugs")
+    logger.info("[drug_agent] Found %s drugs", len(results))
     return results
 
 
@@ -469,7 +469,7 @@ async def _get_drug_details(
     Returns:
         DrugDetails or None if not found.
     """
-    logger.debug(f"[drug_agent] Getting details for: {registration_number}")
+    logger.debug("[drug_agent] Getting details for: %s", registration_number)
 
     response = await client.call_tool(
         "get_drug_details",
@@ -477,7 +477,7 @@ async def _get_drug_details(
     )
 
     if not response.success:
-        logger.warning(f"[drug_agent] Details lookup failed: {response.error}")
+        logger.warning("[drug_agent] Details lookup failed: %s", response.error)
         return None
 
     data = response.data
@@ -511,7 +511,7 @@ async def _get_reimbursement(
     Returns:
         ReimbursementInfo or None if not found.
     """
-    logger.debug(f"[drug_agent] Getting reimbursement for: {registration_number}")
+    logger.debug("[drug_agent] Getting reimbursement for: %s", registration_number)
 
     response = await client.call_tool(
         "get_reimbursement",
@@ -533,7 +533,7 @@ async def _get_reimbursement(
             conditions=data.get("conditions", []),
         )
     except Exception as e:
-        logger.warning(f"[drug_agent] Invalid reimbursement data: {e}")
+        logger.warning("[drug_agent] Invalid reimbursement data: %s", e)
         return None
 
 
@@ -549,7 +549,7 @@ async def _check_availability(
     Returns:
         AvailabilityInfo or None if not found.
     """
-    logger.debug(f"[drug_agent] Checking availability for: {registration_number}")
+    logger.debug("[drug_agent] Checking availability for: %s", registration_number)
 
     response = await client.call_tool(
         "check_availability",
@@ -575,7 +575,7 @@ async def _check_availability(
             alternatives=alternatives,
         )
     except Exception as e:
-        logger.warning(f"[drug_agent] Invalid availability data: {e}")
+        logger.warning("[drug_agent] Invalid availability data: %s", e)
         return None
 
 
@@ -592,7 +592,7 @@ async def _search_by_atc(
     Returns:
         List of matching drug results.
     """
-    logger.debug(f"[drug_agent] Searching by ATC: {atc_code}")
+    logger.debug("[drug_agent] Searching by ATC: %s", atc_code)
 
     response = await client.call_tool(
         "search_by_atc",
@@ -624,7 +624,7 @@ async def _search_by_ingredient(
     Returns:
         List of matching drug results.
     """
-    logger.debug(f"[drug_agent] Searching by ingredient: {ingredient}")
+    logger.debug("[drug_agent] Searching by ingredient: %s", ingredient)
 
     response = await client.call_tool(
         "search_by_ingredient",
@@ -707,7 +707,7 @@ async def drug_agent_node(
     # Priority 1: Explicit drug_query in state
     if state.drug_query:
         query = state.drug_query
-        logger.debug(f"[drug_agent_node] Using explicit query: {query.query_text}")
+        logger.debug("[drug_agent_node] Using explicit query: %s", query.query_text)
 
     # Priority 2: Parse from last user message
     if not query and state.messages:
@@ -718,8 +718,9 @@ async def drug_agent_node(
             drug_name = extract_drug_name(content)
             query = DrugQuery(query_text=drug_name, query_type=query_type)
             logger.info(
-                f"[drug_agent_node] Extracted drug name: '{drug_name}' "
-                f"from: '{content[:50]}...'"
+                "[drug_agent_node] Extracted drug name: '%s' from: '%s...'",
+                drug_name,
+                content[:50],
             )
 
     if not query:
@@ -859,11 +860,11 @@ async def drug_agent_node(
                 )
 
     except (MCPConnectionError, MCPTimeoutError, MCPServerError) as e:
-        logger.error(f"[drug_agent_node] MCP error: {e}")
+        logger.error("[drug_agent_node] MCP error: %s", e)
         response_text = format_mcp_error(e)
 
     except Exception as e:
-        logger.exception(f"[drug_agent_node] Unexpected error: {e}")
+        logger.exception("[drug_agent_node] Unexpected error: %s", e)
         response_text = "Při zpracování dotazu došlo k neočekávané chybě."
 
     # Add citation reference if documents found
@@ -871,7 +872,7 @@ async def drug_agent_node(
         response_text += "\n\n_Zdroj: SÚKL - Státní ústav pro kontrolu léčiv_"
 
     # Exit logging
-    logger.info(f"[drug_agent_node] Completed. Found {len(documents)} documents.")
+    logger.info("[drug_agent_node] Completed. Found %s documents.", len(documents))
 
     return {
         "messages": [{"role": "assistant", "content": response_text}],
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 
 from agent.constants import DEFAULT_MODEL_NAME, LLM_TIMEOUT
 from agent.utils.message_utils import extract_message_content
+from agent.utils.response_cache import ResponseCache
 
 if TYPE_CHECKING:
     from langgraph.runtime import Runtime
@@ -25,6 +26,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = (
+    "Jsi Czech MedAI, klinický rozhodovací asistent pro české lékaře. "
+    "Odpovídáš vždy v češtině s korektní lékařskou terminologií. "
+    "Poskytuj stručné, faktické a odborné odpovědi. "
+    "Pokud dotaz nesouvisí s medicínou, zdvořile to uveď a nabídni pomoc "
+    "s lékařským dotazem. "
+    "NIKDY nevymýšlej citace ani zdroje, které nemáš k dispozici."
+)
+
+# Answers for repeated quick-mode queries (deep mode always calls the LLM)
+_response_cache = ResponseCache()
+
 
 async def general_agent_node(state: State, runtime: Runtime[Context]) -> dict[str, Any]:
     """Answer general medical questions using LLM.
@@ -56,6 +69,14 @@ async def general_agent_node(state: State, runtime: Runtime[Context]) -> dict[st
 
     user_content = extract_message_content(last_message)
 
+    use_cache = context.get("mode", "quick") != "deep"
+    cache_key = ResponseCache.make_key(model_name, SYSTEM_PROMPT, user_content)
+    if use_cache:
+        cached_answer = _response_cache.get(cache_key)
+        if cached_answer is not None:
+            logger.info("general_agent_node response cache hit")
+            return {"messages": [{"role": "assistant", "content": cached_answer}]}
+
     try:
         from agent.utils.llm_cache import get_llm
 
@@ -66,18 +87,9 @@ async def general_agent_node(state: State, runtime: Runtime[Context]) -> dict[st
             max_tokens=2048,
         )
 
-        system_prompt = (
-            "Jsi Czech MedAI, klinický rozhodovací asistent pro české lékaře. "
-            "Odpovídáš vždy v češtině s korektní lékařskou terminologií. "
-            "Poskytuj stručné, faktické a odborné odpovědi. "
-            "Pokud dotaz nesouvisí s medicínou, zdvořile to uveď a nabídni pomoc "
-            "s lékařským dotazem. "
-            "NIKDY nevymýšlej citace ani zdroje, které nemáš k dispozici."
-        )
-
         response = await llm.ainvoke(
             [
-                SystemMessage(content=system_prompt),
+                SystemMessage(content=SYSTEM_PROMPT),
                 HumanMessage(content=user_content),
             ]
         )
@@ -87,6 +99,8 @@ async def general_agent_node(state: State, runtime: Runtime[Context]) -> dict[st
             if isinstance(response.content, str)
             else str(response.content)
         )
+        if use_cache:
+            _response_cache.set(cache_key, answer)
 
     except Exception as e:
         logger.error("general_agent_node LLM call failed: %s", e)
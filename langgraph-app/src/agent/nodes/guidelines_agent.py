@@ -234,13 +234,13 @@ async def search_guidelines_semantic(
         )
 
     logger.debug(
-        f"[guidelines_agent] Creating embedding for: {query.query_text[:100]}..."
+        "[guidelines_agent] Creating embedding for: %s...", query.query_text[:100]
     )
 
     # Create embedding for query
     embedding = await _create_query_embedding(query.query_text, api_key)
 
-    logger.debug(f"[guidelines_agent] Searching with limit={query.limit}")
+    logger.debug("[guidelines_agent] Searching with limit=%s", query.limit)
 
     # Search with filters
     results = await search_guidelines(
@@ -299,7 +299,7 @@ async def guidelines_agent_node(
     if state.guideline_query:
         query = state.guideline_query
         logger.debug(
-            f"[guidelines_agent_node] Using explicit query: {query.query_text}"
+            "[guidelines_agent_node] Using explicit query: %s", query.query_text
         )
 
     # Priority 2: Parse from last user message
@@ -310,7 +310,7 @@ async def guidelines_agent_node(
             query_type = classify_guideline_query(content)
             query = GuidelineQuery(query_text=content, query_type=query_type)
             logger.debug(
-                f"[guidelines_agent_node] Parsed query from message: {content[:50]}..."
+                "[guidelines_agent_node] Parsed query from message: %s...", content[:50]
             )
 
     if not query:
@@ -332,7 +332,7 @@ async def guidelines_agent_node(
     try:
         if query.query_type == GuidelineQueryType.SECTION_LOOKUP:
             # Direct lookup by guideline ID
-            logger.debug(f"[guidelines_agent_node] Section lookup: {query.query_text}")
+            logger.debug("[guidelines_agent_node] Section lookup: %s", query.query_text)
 
             # Extract guideline ID from query
             guideline_id_pattern = r"\b((?:CLS-JEP|ESC|ERS)-\d{4}-\d{3})\b"
@@ -394,7 +394,7 @@ async def guidelines_agent_node(
         else:
             # Semantic search
             logger.debug(
-                f"[guidelines_agent_node] Semantic search: {query.query_text[:100]}..."
+                "[guidelines_agent_node] Semantic search: %s...", query.query_text[:100]
             )
 
             try:
@@ -415,7 +415,8 @@ async def guidelines_agent_node(
                     # Check if we had results but they were filtered out
                     if results:
                         logger.warning(
-                            f"[guidelines_agent_node] {len(results)} results filtered out by threshold"
+                            "[guidelines_agent_node] %s results filtered out by threshold",
+                            len(results),
                         )
                         return {
                             "messages": [
@@ -484,16 +485,16 @@ async def guidelines_agent_node(
                 }
 
     except GuidelinesStorageError as e:
-        logger.error(f"[guidelines_agent_node] Storage error: {e}")
+        logger.error("[guidelines_agent_node] Storage error: %s", e)
         response_text = format_guidelines_error(e)
 
     except ValueError as e:
         # Missing OpenAI API key or invalid query
-        logger.error(f"[guidelines_agent_node] Configuration error: {e}")
+        logger.error("[guidelines_agent_node] Configuration error: %s", e)
         response_text = str(e)
 
     except Exception as e:
-        logger.exception(f"[guidelines_agent_node] Unexpected error: {e}")
+        logger.exception("[guidelines_agent_node] Unexpected error: %s", e)
         response_text = "Při zpracování dotazu došlo k neočekávané chybě."
 
     # Add citation footer if documents found
@@ -502,7 +503,7 @@ async def guidelines_agent_node(
 
     # Exit logging
     logger.info(
-        f"[guidelines_agent_node] Completed. Found {len(documents)} guidelines."
+        "[guidelines_agent_node] Completed. Found %s guidelines.", len(documents)
     )
 
     return {
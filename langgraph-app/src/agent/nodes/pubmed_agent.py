@@ -23,6 +23,7 @@ from agent.models.research_models import (
     PubMedArticle,
     ResearchQuery,
 )
+from agent.utils.keyword_routing import RESEARCH_KEYWORDS
 from agent.utils.message_utils import extract_message_content
 from agent.utils.timeout import with_timeout
 
@@ -95,9 +96,7 @@ def classify_research_query(message: str) -> ResearchQuery | None:
             query_type="pmid_lookup",
         )
 
-    # Check for research keywords (lazy import to avoid circular dependency)
-    from agent.graph import RESEARCH_KEYWORDS
-
+    # Check for research keywords
     has_research_keyword = any(
         keyword in message_lower for keyword in RESEARCH_KEYWORDS
     )
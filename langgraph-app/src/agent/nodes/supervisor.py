@@ -39,8 +39,14 @@ from agent.models.supervisor_models import (
 from agent.nodes.supervisor_prompts import (
     build_classification_prompt,
     build_function_schema,
+    classification_prompt_fingerprint,
+)
+from agent.utils.keyword_routing import (
+    match_keyword_categories,
+    normalize_keyword_text,
 )
 from agent.utils.message_utils import extract_message_content
+from agent.utils.response_cache import ResponseCache
 
 if TYPE_CHECKING:
     from langgraph.runtime import Runtime
@@ -49,6 +55,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# LLM classifications shared across supervisor_node calls (serialized IntentResult)
+_classification_cache = ResponseCache()
+
 
 class IntentClassifier:
     """LLM-based intent classifier using Claude function calling.
@@ -60,6 +69,7 @@ class IntentClassifier:
         model_name: Claude model name (default: claude-sonnet-4).
         temperature: Temperature for generation (default: 0.0).
         llm: ChatAnthropic instance for API calls.
+        cache: Optional cache of successful LLM classifications.
 
     Example:
         >>> classifier = IntentClassifier()
@@ -75,6 +85,7 @@ class IntentClassifier:
         model_name: str | None = None,
         temperature: float = 0.0,
         llm: ChatAnthropic | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize the IntentClassifier.
 
@@ -85,10 +96,18 @@ class IntentClassifier:
                  If None, ChatAnthropic is instantiated lazily on first
                  classify_intent call (avoids requiring ANTHROPIC_API_KEY
                  at import/construction time).
+            cache: Optional ResponseCache for successful LLM classifications,
+                keyed by a SHA-256 hash of model, temperature, prompt
+                fingerprint and normalized message, so the message itself is
+                never stored. The cached IntentResult reasoning may echo
+                patient data and is kept in memory for the cache TTL (see
+                agent.utils.response_cache). Keyword fallback results are
+                never cached.
         """
         self.model_name = model_name or DEFAULT_MODEL_NAME
         self.temperature = temperature
         self.llm = llm
+        self.cache = cache
 
     async def classify_intent(self, message: str) -> IntentResult:
         """Classify user message intent using Claude function calling.
@@ -120,6 +139,18 @@ class IntentClassifier:
 
         message = message.strip()
 
+        cache_key: str | None = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(
+                f"{self.model_name}@{self.temperature}",
+                classification_prompt_fingerprint(),
+                message,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("[IntentClassifier] Classification cache hit")
+                return IntentResult.model_validate_json(cached)
+
         try:
             # Lazy-init LLM on first call (avoids requiring API key at construction)
             if self.llm is None:
@@ -165,13 +196,17 @@ class IntentClassifier:
             # Log low confidence warning
             if result.confidence < 0.5:
                 logger.warning(
-                    f"[IntentClassifier] Low confidence ({result.confidence:.2f}) "
-                    f"for query: {message[:50]}..."
+                    "[IntentClassifier] Low confidence (%.2f) for query: %s...",
+                    result.confidence,
+                    message[:50],
                 )
 
             # Log classification
             log_intent_classification(result, message)
 
+            if self.cache is not None and cache_key is not None:
+                self.cache.set(cache_key, result.model_dump_json())
+
             return result
 
         except (ValueError, KeyError, TypeError) as e:
@@ -203,16 +238,32 @@ def validate_agent_names(agents: list[str]) -> list[str]:
     return [a for a in agents if a in VALID_AGENT_NAMES]
 
 
+# Keyword category -> (intent type, agent, fallback reasoning)
+_KEYWORD_CATEGORY_ROUTES: dict[str, tuple[IntentType, str, str]] = {
+    "drug": (IntentType.DRUG_INFO, "drug_agent", "Fallback: Drug keywords detected"),
+    "research": (
+        IntentType.RESEARCH_QUERY,
+        "pubmed_agent",
+        "Fallback: Research keywords detected",
+    ),
+    "guidelines": (
+        IntentType.GUIDELINE_LOOKUP,
+        "guidelines_agent",
+        "Fallback: Guidelines keywords detected",
+    ),
+}
+
+
 def fallback_to_keyword_routing(message: str) -> IntentResult:
     """Keyword-based routing for user queries.
 
-    Single source of truth for keyword matching. Used by both:
-    - IntentClassifier (as LLM fallback)
-    - route_query() in graph.py (as direct keyword router)
-
-    Priority: Drug > Research > Guidelines > General.
+    Used by IntentClassifier and supervisor_node as the LLM fallback.
+    route_query() in graph.py routes with the same matcher and priority.
 
-    Uses DRUG_KEYWORDS, RESEARCH_KEYWORDS, GUIDELINES_KEYWORDS from graph.py.
+    Priority: Drug > Research > Guidelines > General. When keywords from
+    several categories are present, the result is a COMPOUND_QUERY listing
+    every matching agent in priority order, so the supervisor can fan out to
+    them in parallel while route_query() keeps using the first one.
 
     Args:
         message: User query text.
@@ -227,36 +278,24 @@ def fallback_to_keyword_routing(message: str) -> IntentResult:
         >>> "Fallback" in result.reasoning
         True
     """
-    # Import keywords from graph.py (lazy import to avoid circular deps)
-    from agent.graph import DRUG_KEYWORDS, GUIDELINES_KEYWORDS, RESEARCH_KEYWORDS
+    categories = match_keyword_categories(normalize_keyword_text(message))
 
-    message_lower = message.lower()
-
-    # Drug keywords first (most common use case)
-    if any(kw in message_lower for kw in DRUG_KEYWORDS):
+    # Several categories: call every matching agent in parallel, primary first
+    if len(categories) > 1:
         return IntentResult(
-            intent_type=IntentType.DRUG_INFO,
+            intent_type=IntentType.COMPOUND_QUERY,
             confidence=0.6,
-            agents_to_call=["drug_agent"],
-            reasoning="Fallback: Drug keywords detected",
+            agents_to_call=[_KEYWORD_CATEGORY_ROUTES[c][1] for c in categories],
+            reasoning=f"Fallback: Keywords detected for {', '.join(categories)}",
         )
 
-    # Research keywords (research-specific terms only)
-    if any(kw in message_lower for kw in RESEARCH_KEYWORDS):
+    if categories:
+        intent_type, agent_name, reasoning = _KEYWORD_CATEGORY_ROUTES[categories[0]]
         return IntentResult(
-            intent_type=IntentType.RESEARCH_QUERY,
+            intent_type=intent_type,
             confidence=0.6,
-            agents_to_call=["pubmed_agent"],
-            reasoning="Fallback: Research keywords detected",
-        )
-
-    # Guidelines keywords
-    if any(kw in message_lower for kw in GUIDELINES_KEYWORDS):
-        return IntentResult(
-            intent_type=IntentType.GUIDELINE_LOOKUP,
-            confidence=0.6,
-            agents_to_call=["guidelines_agent"],
-            reasoning="Fallback: Guidelines keywords detected",
+            agents_to_call=[agent_name],
+            reasoning=reasoning,
         )
 
     # Default: general medical
@@ -283,12 +322,13 @@ def log_intent_classification(result: IntentResult, message: str) -> None:
         # Logs: [IntentClassifier] Intent: drug_info, Confidence: 0.95, ...
     """
     logger.info(
-        f"[IntentClassifier] Intent: {result.intent_type.value}, "
-        f"Confidence: {result.confidence:.2f}, "
-        f"Agents: {result.agents_to_call}, "
-        f"Query: {message[:50]}..."
+        "[IntentClassifier] Intent: %s, Confidence: %.2f, Agents: %s, Query: %s...",
+        result.intent_type.value,
+        result.confidence,
+        result.agents_to_call,
+        message[:50],
     )
-    logger.debug(f"[IntentClassifier] Reasoning: {result.reasoning}")
+    logger.debug("[IntentClassifier] Reasoning: %s", result.reasoning)
 
 
 async def supervisor_node(
@@ -354,30 +394,27 @@ async def supervisor_node(
     classifier = IntentClassifier(
         model_name=context.get("model_name", DEFAULT_MODEL_NAME),
         temperature=context.get("temperature", 0.0),
+        cache=_classification_cache,
     )
 
     try:
         result = await classifier.classify_intent(content)
         logger.info(
-            f"[supervisor_node] Intent: {result.intent_type.value}, "
-            f"Confidence: {result.confidence:.2f}, "
-            f"Agents: {result.agents_to_call}"
+            "[supervisor_node] Intent: %s, Confidence: %.2f, Agents: %s",
+            result.intent_type.value,
+            result.confidence,
+            result.agents_to_call,
         )
     except (ValueError, KeyError, TypeError, OSError) as e:
         logger.error("[supervisor_node] Classification failed: %s", e)
-        # Fallback to keyword routing
-        from agent.graph import route_query
-
-        fallback_node = route_query(state)
-        logger.info("[supervisor_node] Fallback routing to: %s", fallback_node)
-        return Send(fallback_node, state)
+        # Fallback to keyword routing (explicit queries were handled above,
+        # so route on the already-extracted content)
+        result = fallback_to_keyword_routing(content)
+        logger.info("[supervisor_node] Fallback routing to: %s", result.agents_to_call)
     except Exception as e:
         logger.exception("[supervisor_node] Unexpected classification error: %s", e)
-        from agent.graph import route_query
-
-        fallback_node = route_query(state)
-        logger.info("[supervisor_node] Fallback routing to: %s", fallback_node)
-        return Send(fallback_node, state)
+        result = fallback_to_keyword_routing(content)
+        logger.info("[supervisor_node] Fallback routing to: %s", result.agents_to_call)
 
     # Validate agents
     valid_agents = validate_agent_names(result.agents_to_call)
@@ -398,13 +435,13 @@ async def supervisor_node(
 
             if agent_name == "drug_agent" and not sukl_client:
                 logger.warning(
-                    f"[supervisor_node] SUKL client unavailable, skipping {agent_name}"
+                    "[supervisor_node] SUKL client unavailable, skipping %s", agent_name
                 )
                 continue
             elif agent_name == "pubmed_agent" and not biomcp_client:
                 logger.warning(
-                    f"[supervisor_node] BioMCP client unavailable, "
-                    f"skipping {agent_name}"
+                    "[supervisor_node] BioMCP client unavailable, skipping %s",
+                    agent_name,
                 )
                 continue
 
@@ -413,7 +450,7 @@ async def supervisor_node(
 
         # Create Send command for this agent
         send_commands.append(Send(target_node, state))
-        logger.info(f"[supervisor_node] Scheduling agent: {target_node}")
+        logger.info("[supervisor_node] Scheduling agent: %s", target_node)
 
     # Fallback if no valid agents after availability checks
     if not send_commands:
@@ -422,7 +459,7 @@ async def supervisor_node(
         )
         return Send("general_agent", state)
 
-    logger.info(f"[supervisor_node] Parallel execution: {len(send_commands)} agent(s)")
+    logger.info("[supervisor_node] Parallel execution: %d agent(s)", len(send_commands))
 
     # Return single Send or list for parallel execution
     if len(send_commands) == 1:
@@ -6,6 +6,9 @@ intent classification in the Czech MedAI supervisor agent.
 The prompts are designed for Claude function calling with structured output.
 """
 
+import functools
+import hashlib
+import json
 from typing import Any
 
 from agent.models.supervisor_models import IntentType
@@ -250,3 +253,18 @@ def build_function_schema() -> dict[str, Any]:
             "required": ["intent_type", "confidence", "agents_to_call", "reasoning"],
         },
     }
+
+
+@functools.cache
+def classification_prompt_fingerprint() -> str:
+    """Fingerprint of the classification prompt template and function schema.
+
+    Used in classification cache keys, so cached results are not reused after
+    the prompt, few-shot examples or schema change.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    template = build_classification_prompt("", include_examples=True)
+    schema = json.dumps(build_function_schema(), sort_keys=True)
+    return hashlib.sha256(f"{template}\0{schema}".encode()).hexdigest()
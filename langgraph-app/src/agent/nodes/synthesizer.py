@@ -517,8 +517,8 @@ async def synthesizer_node(
 
     # Entry logging
     logger.info(
-        f"[synthesizer_node] Starting synthesis of "
-        f"{len(agent_messages)} agent responses"
+        "[synthesizer_node] Starting synthesis of %s agent responses",
+        len(agent_messages),
     )
 
     # If no agent messages, return empty
@@ -544,9 +544,9 @@ async def synthesizer_node(
         # Validate terminology
         validation = validate_czech_terminology(msg_text)
         logger.info(
-            f"[synthesizer_node] Terminology: "
-            f"warnings={len(validation['warnings'])}, "
-            f"suggestions={len(validation['suggestions'])}"
+            "[synthesizer_node] Terminology: warnings=%s, suggestions=%s",
+            len(validation["warnings"]),
+            len(validation["suggestions"]),
         )
 
         # Format as quick consult (brevity: 3-5 sentences)
@@ -563,8 +563,8 @@ async def synthesizer_node(
             formatted += f"\n\n## Reference\n{refs}"
 
         logger.info(
-            f"[synthesizer_node] Completed (single agent). "
-            f"Final message length: {len(formatted)} chars"
+            "[synthesizer_node] Completed (single agent). Final message length: %s chars",
+            len(formatted),
         )
 
         return {
@@ -584,7 +584,7 @@ async def synthesizer_node(
 
     # Detect agent types from message content
     agent_types = _detect_agent_types(agent_messages)
-    logger.info(f"[synthesizer_node] Detected agent types: {agent_types}")
+    logger.info("[synthesizer_node] Detected agent types: %s", agent_types)
 
     # Renumber citations globally
     updated_messages, global_references = renumber_citations(
@@ -635,8 +635,8 @@ async def synthesizer_node(
 
     except Exception as e:
         logger.warning(
-            f"[synthesizer_node] LLM synthesis failed: {e} - "
-            "falling back to concatenation"
+            "[synthesizer_node] LLM synthesis failed: %s - falling back to concatenation",
+            e,
         )
         # Fallback: simple concatenation with section headers
         sections = []
@@ -647,9 +647,9 @@ async def synthesizer_node(
     # Validate Czech terminology
     validation = validate_czech_terminology(combined_text)
     logger.info(
-        f"[synthesizer_node] Terminology: "
-        f"warnings={len(validation['warnings'])}, "
-        f"suggestions={len(validation['suggestions'])}"
+        "[synthesizer_node] Terminology: warnings=%s, suggestions=%s",
+        len(validation["warnings"]),
+        len(validation["suggestions"]),
     )
 
     # Format response with agent types for compound section headers
@@ -667,7 +667,7 @@ async def synthesizer_node(
 
     # Exit logging
     logger.info(
-        f"[synthesizer_node] Completed. Final message length: {len(formatted)} chars"
+        "[synthesizer_node] Completed. Final message length: %s chars", len(formatted)
     )
 
     return {
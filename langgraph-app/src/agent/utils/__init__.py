@@ -6,6 +6,7 @@ Modules:
     pdf_processor: PDF processing and chunking utilities (Feature 006).
     guidelines_storage: Async storage utilities for guidelines with pgvector.
     timeout: Timeout wrapper for async agent nodes (Feature 007).
+    keyword_routing: Routing keyword sets and single-pass keyword matcher.
 """
 
 from agent.utils.guidelines_storage import (
@@ -0,0 +1,269 @@
+"""Keyword matching for query routing.
+
+Single source of the routing keyword sets and the one-pass matcher used by
+route_query() in graph.py and by the supervisor's keyword fallback.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import re
+import unicodedata
+from collections.abc import Iterable
+
+# Keyword sets are immutable and must contain only lowercase NFC entries. They
+# are folded with normalize_keyword_text() when the routing pattern is built,
+# so matching ignores Czech diacritics ("lek" matches "lék"); keywords of up to
+# four letters must then start a word (see _needs_word_start).
+
+# Drug-related keywords for routing (Czech + English)
+DRUG_KEYWORDS: frozenset[str] = frozenset(
+    {
+        # Czech
+        "lék",
+        "léky",
+        "léčivo",
+        "léčiva",
+        "prášky",
+        "tablety",
+        "pilulky",
+        "složení",
+        "účinná látka",
+        "indikace",
+        "kontraindikace",
+        "dávkování",
+        "úhrada",
+        "cena",
+        "doplatek",
+        "dostupnost",
+        "alternativa",
+        "súkl",
+        "atc",
+        "registrační",
+        # English fallback
+        "drug",
+        "medicine",
+        "medication",
+        "pill",
+        "tablet",
+        "ingredient",
+        "dosage",
+        "reimbursement",
+        "availability",
+    }
+)
+
+# Research-related keywords for routing (Czech + English)
+RESEARCH_KEYWORDS: frozenset[str] = frozenset(
+    {
+        # Czech - research-SPECIFIC terms (must clearly indicate research intent)
+        "studie",
+        "výzkum",
+        "pubmed",
+        "článek",
+        "články",
+        "literatura",
+        "pmid",
+        "výzkumný",
+        "klinická studie",
+        "klinický výzkum",
+        "randomizovaná studie",
+        "meta-analýza",
+        "review",
+        "evidence",
+        "důkazy",
+        "publikace",
+        # English fallback - research specific
+        "study",
+        "research",
+        "article",
+        "literature",
+        "paper",
+        "clinical trial",
+        "meta-analysis",
+        "systematic review",
+        "publication",
+    }
+)
+
+# Generic medical terms - these alone DON'T indicate research intent.
+# They're used by the LLM classifier (supervisor) for context, NOT keyword routing.
+# Moved OUT of RESEARCH_KEYWORDS to fix routing overlap:
+# "léčba", "léčení", "terapie", "onemocnění", "nemoc", "choroba",
+# "syndrom", "symptom", "příznaky", "diagnóza", "diagnostika",
+# "prevence", "prognóza", "komplikace", "riziko", "účinnost",
+# "bezpečnost", "diabetes", "diabetu", "cukrovka", etc.
+
+# Guidelines-related keywords for routing (Czech + English)
+GUIDELINES_KEYWORDS: frozenset[str] = frozenset(
+    {
+        # Czech
+        "guidelines",
+        "doporučené postupy",
+        "doporučení",
+        "standardy",
+        "standard",
+        "protokol",
+        "algoritmus",
+        "cls jep",
+        "cls-jep",
+        "esc",
+        "ers",
+        "léčebný postup",
+        "diagnostický postup",
+        "klinické doporučení",
+        # English fallback
+        "guideline",
+        "recommendation",
+        "protocol",
+        "algorithm",
+        "clinical practice",
+    }
+)
+
+
+# Folded keywords this short ("lek", "cena", "esc") must start a word: without
+# diacritics they otherwise match inside unrelated words ("elektrolyty",
+# "ocenění", "deescalation")
+_WORD_START_MAX_LENGTH = 4
+
+
+def _needs_word_start(keyword: str) -> bool:
+    """Return whether a folded keyword only matches at the start of a word."""
+    return len(keyword) <= _WORD_START_MAX_LENGTH
+
+
+def _keyword_alternation(keywords: Iterable[str]) -> str:
+    """Build a regex alternation matching any of the keywords as substrings.
+
+    Short keywords (see _needs_word_start) match only at the start of a word.
+
+    Args:
+        keywords: Lowercase keywords.
+
+    Returns:
+        Regex source of the alternation.
+    """
+    # Sorted for a deterministic pattern; longest first so overlapping
+    # keywords report the most specific match
+    ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+    return "|".join(
+        (r"(?<!\w)" if _needs_word_start(kw) else "") + re.escape(kw) for kw in ordered
+    )
+
+
+# Keyword categories in routing priority order (Drug > Research > Guidelines)
+KEYWORD_CATEGORIES: tuple[str, ...] = ("drug", "research", "guidelines")
+_CATEGORY_BITS = {name: 1 << i for i, name in enumerate(KEYWORD_CATEGORIES)}
+_ALL_CATEGORIES_MASK = (1 << len(KEYWORD_CATEGORIES)) - 1
+
+
+# Folds case-folded Czech diacritics to ASCII and drops combining marks, so
+# decomposed (NFD) input such as "e" + combining acute folds the same as "é"
+_DIACRITIC_MAP = str.maketrans(
+    "áčďéěíňóřšťúůýž",
+    "acdeeinorstuuyz",
+    "".join(map(chr, range(0x300, 0x370))),
+)
+
+
+def normalize_keyword_text(text: str) -> str:
+    """Prepare text for keyword matching.
+
+    Non-ASCII text is NFKC-normalized first, so compatibility forms pasted
+    from documents (no-break spaces, ligatures, full-width letters) match
+    plain keywords. The text is then case-folded and diacritics are
+    stripped with a single ``str.translate`` pass, so users typing without
+    diacritics (e.g. "davkovani leku") still match keywords like
+    "dávkování". Keywords are folded the same way when the routing pattern
+    is built. Not memoized: messages may contain patient data, which must
+    not outlive the request in a process-wide cache.
+
+    Args:
+        text: Raw message text.
+
+    Returns:
+        Case-folded text without diacritics.
+    """
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+    return text.casefold().translate(_DIACRITIC_MAP)
+
+
+def _build_keyword_masks() -> dict[str, int]:
+    """Map each keyword to the category bitmask of every keyword it starts with.
+
+    The routing pattern reports only the longest keyword at each position.
+    Every other keyword matching at that position is a prefix of it, so
+    folding prefix categories into the mask keeps the single scan exact. A
+    word-start prefix is folded only into keywords that are word-start too,
+    since a longer keyword may match where the prefix is not allowed to.
+    """
+    masks: dict[str, int] = {}
+    for name, keywords in zip(
+        KEYWORD_CATEGORIES, (DRUG_KEYWORDS, RESEARCH_KEYWORDS, GUIDELINES_KEYWORDS)
+    ):
+        for keyword in map(normalize_keyword_text, keywords):
+            masks[keyword] = masks.get(keyword, 0) | _CATEGORY_BITS[name]
+    return {
+        keyword: functools.reduce(
+            operator.or_,
+            (
+                mask
+                for prefix, mask in masks.items()
+                if keyword.startswith(prefix)
+                and _needs_word_start(prefix) <= _needs_word_start(keyword)
+            ),
+        )
+        for keyword in masks
+    }
+
+
+# Keyword -> category bitmask (drug=1, research=2, guidelines=4)
+_KEYWORD_MASKS = _build_keyword_masks()
+# Texts shorter than this ("ok", "ne") cannot contain any keyword
+_MIN_KEYWORD_LENGTH = min(map(len, _KEYWORD_MASKS))
+
+# All keywords in one pattern. The zero-width lookahead tests every position
+# and reports the longest keyword there, so one finditer() pass over the text
+# (in C) finds every keyword category present.
+KEYWORD_ROUTING_PATTERN = re.compile(f"(?=({_keyword_alternation(_KEYWORD_MASKS)}))")
+
+
+def match_keyword_categories(text_lower: str) -> tuple[str, ...]:
+    """Find every keyword category present in text.
+
+    Equivalent to checking ``any(normalize_keyword_text(kw) in text_lower
+    for kw in KEYWORDS)`` for each category, but scans the text once,
+    stopping as soon as all categories are found. Short keywords must start
+    a word, so "lek" does not match inside "elektrolyty".
+
+    Args:
+        text_lower: Message text prepared by normalize_keyword_text().
+
+    Returns:
+        Matched categories in priority order (Drug > Research > Guidelines),
+        empty if no keyword matches.
+    """
+    if len(text_lower) < _MIN_KEYWORD_LENGTH:
+        return ()
+    mask = 0
+    for match in KEYWORD_ROUTING_PATTERN.finditer(text_lower):
+        mask |= _KEYWORD_MASKS[match.group(1)]
+        if mask == _ALL_CATEGORIES_MASK:
+            break
+    return tuple(name for name, bit in _CATEGORY_BITS.items() if mask & bit)
+
+
+def match_keyword_category(text_lower: str) -> str | None:
+    """Find the highest-priority keyword category present in text.
+
+    Args:
+        text_lower: Message text prepared by normalize_keyword_text().
+
+    Returns:
+        "drug", "research" or "guidelines", or None if no keyword matches.
+    """
+    categories = match_keyword_categories(text_lower)
+    return categories[0] if categories else None
@@ -21,7 +21,8 @@ def extract_message_content(message: Any) -> str:
     Supports three message formats:
     1. Dict with "content" key: {"role": "user", "content": "text"}
     2. Message object with content attribute: HumanMessage(content="text")
-    3. Multimodal list format: [{"type": "text", "text": "..."}] or ["text"]
+    3. Multimodal list format: [{"type": "text", "text": "..."}] or ["text"];
+       all text blocks are joined with a space, non-text blocks are skipped.
 
     Args:
         message: Message object (dict, AIMessage, HumanMessage, etc.).
@@ -45,12 +46,14 @@ def extract_message_content(message: Any) -> str:
     if isinstance(raw_content, str):
         return raw_content
 
-    # Handle multimodal list format
-    if isinstance(raw_content, list) and raw_content:
-        first_block = raw_content[0]
-        if isinstance(first_block, str):
-            return first_block
-        elif isinstance(first_block, dict) and "text" in first_block:
-            return str(first_block["text"])
+    # Handle multimodal list format: join all text blocks, skip others (images)
+    if isinstance(raw_content, list):
+        texts: list[str] = []
+        for block in raw_content:
+            if isinstance(block, str):
+                texts.append(block)
+            elif isinstance(block, dict) and "text" in block:
+                texts.append(str(block["text"]))
+        return " ".join(texts)
 
     return ""
@@ -0,0 +1,121 @@
+"""In-process LLM response cache.
+
+Exact-match cache for LLM answers keyed by SHA-256 of the model name, system
+prompt and normalized user query. Entries expire after a TTL and the cache is
+bounded with LRU eviction, so repeated queries skip the LLM round-trip.
+
+PHI retention: user queries in a medical assistant may contain patient data.
+Queries are never stored; keys are one-way hashes, so a query cannot be read
+back from the cache. Cached values (answers, classification reasoning) may
+still echo parts of the query, so they stay in process memory for up to the
+TTL (24 hours by default) and are capped at ``max_entry_chars`` per entry;
+larger values are not cached. Entries live only in this process and are
+dropped on restart or ``clear()``.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+DEFAULT_RESPONSE_CACHE_TTL = 24 * 60 * 60  # 24 hours
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+DEFAULT_RESPONSE_CACHE_MAX_ENTRY_CHARS = 8192
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize a user query for cache lookup.
+
+    Collapses whitespace and lowercases, so queries differing only in
+    spacing or capitalization share a cache entry.
+
+    Args:
+        text: Raw user query.
+
+    Returns:
+        Normalized query text.
+    """
+    return " ".join(text.split()).lower()
+
+
+class ResponseCache:
+    """Bounded TTL cache mapping (model, system prompt, query) to an answer.
+
+    Example:
+        >>> cache = ResponseCache(ttl=3600)
+        >>> key = cache.make_key("claude-sonnet-4", "system", "Co je ibuprofen?")
+        >>> cache.set(key, "Ibuprofen je NSAID.")
+        >>> cache.get(key)
+        'Ibuprofen je NSAID.'
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESPONSE_CACHE_TTL,
+        max_size: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        max_entry_chars: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRY_CHARS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Entry lifetime in seconds.
+            max_size: Maximum number of entries (least recently used evicted).
+            max_entry_chars: Largest value stored; longer values are skipped.
+
+        Raises:
+            ValueError: If ttl, max_size or max_entry_chars is not positive.
+        """
+        if ttl <= 0 or max_size <= 0 or max_entry_chars <= 0:
+            raise ValueError("ttl, max_size and max_entry_chars must be positive")
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_entry_chars = max_entry_chars
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def make_key(model_name: str, system_prompt: str, user_content: str) -> str:
+        """Build the cache key for an LLM call.
+
+        Args:
+            model_name: LLM model identifier.
+            system_prompt: System prompt sent with the query.
+            user_content: User query (normalized before hashing).
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        payload = "\0".join((model_name, system_prompt, normalize_prompt(user_content)))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached answer, or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, answer = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return answer
+
+    def set(self, key: str, answer: str) -> None:
+        """Store an answer, evicting the least recently used entry if full.
+
+        Answers longer than ``max_entry_chars`` are not cached, and any
+        previous entry for the key is dropped.
+        """
+        if len(answer) > self.max_entry_chars:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (including expired ones)."""
+        return len(self._entries)
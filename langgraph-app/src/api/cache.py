@@ -17,6 +17,7 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
+from agent.utils.response_cache import normalize_prompt
 from api.config import settings
 
 logger = logging.getLogger(__name__)
@@ -45,7 +46,7 @@ async def get_redis_client() -> Redis | None:
             await _redis_client.ping()
             logger.info("✅ Redis cache connected")
         except RedisError as e:
-            logger.warning(f"⚠️  Redis cache unavailable: {e}")
+            logger.warning("⚠️  Redis cache unavailable: %s", e)
             _redis_client = None
 
     return _redis_client
@@ -54,7 +55,9 @@ async def get_redis_client() -> Redis | None:
 def generate_cache_key(query: str, mode: str) -> str:
     """Generate cache key from query and mode.
 
-    Uses SHA256 hash to ensure consistent key length.
+    Uses SHA256 hash to ensure consistent key length. The query is normalized
+    first (whitespace collapsed, lowercased), so trivially different spellings
+    of the same question share one cache entry.
 
     Args:
         query: User query text.
@@ -63,7 +66,7 @@ def generate_cache_key(query: str, mode: str) -> str:
     Returns:
         Cache key (e.g., "consult:abc123def456:quick").
     """
-    query_hash = hashlib.sha256(query.encode()).hexdigest()
+    query_hash = hashlib.sha256(normalize_prompt(query).encode()).hexdigest()
     return f"consult:{query_hash}:{mode}"
 
 
@@ -86,13 +89,13 @@ async def get_cached_response(query: str, mode: str) -> dict[str, Any] | None:
         cached_data = await client.get(cache_key)
 
         if cached_data:
-            logger.info(f"✅ Cache HIT: {cache_key}")
+            logger.info("✅ Cache HIT: %s", cache_key)
             return json.loads(cached_data)
         else:
-            logger.debug(f"❌ Cache MISS: {cache_key}")
+            logger.debug("❌ Cache MISS: %s", cache_key)
             return None
     except RedisError as e:
-        logger.warning(f"Redis get error: {e}")
+        logger.warning("Redis get error: %s", e)
         return None  # Graceful degradation
 
 
@@ -121,9 +124,9 @@ async def set_cached_response(
             ttl,
             json.dumps(response, ensure_ascii=False),
         )
-        logger.info(f"💾 Cached response: {cache_key} (TTL: {ttl}s)")
+        logger.info("💾 Cached response: %s (TTL: %ss)", cache_key, ttl)
     except RedisError as e:
-        logger.warning(f"Redis set error: {e}")
+        logger.warning("Redis set error: %s", e)
 
 
 async def invalidate_cache(pattern: str = "consult:*") -> int:
@@ -145,8 +148,8 @@ async def invalidate_cache(pattern: str = "consult:*") -> int:
             await client.delete(key)
             deleted += 1
         if deleted:
-            logger.info(f"🗑️  Invalidated {deleted} cache entries")
+            logger.info("🗑️  Invalidated %s cache entries", deleted)
         return deleted
     except RedisError as e:
-        logger.warning(f"Redis invalidate error: {e}")
+        logger.warning("Redis invalidate error: %s", e)
         return 0
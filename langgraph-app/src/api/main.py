@@ -38,7 +38,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Shutdown:
         - Log server shutdown
-        - Cleanup resources (future: close DB connections)
+        - Close MCP client HTTP sessions
     """
     # Setup structured logging
     setup_logging()
@@ -55,25 +55,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Verify MCP clients (non-blocking)
     try:
-        from agent.graph import _biomcp_client, _sukl_client
+        from agent.graph import get_biomcp_client, get_sukl_client
 
-        if _sukl_client:
+        if get_sukl_client():
             logger.info("✅ SÚKL MCP client available")
         else:
             logger.warning("⚠️  SÚKL MCP client unavailable (graceful degradation)")
 
-        if _biomcp_client:
+        if get_biomcp_client():
             logger.info("✅ BioMCP client available")
         else:
             logger.warning("⚠️  BioMCP client unavailable (graceful degradation)")
     except Exception as e:
-        logger.error(f"❌ MCP client verification failed: {e}")
+        logger.error("❌ MCP client verification failed: %s", e)
 
     yield
 
     # Shutdown
     logger.info("🛑 Czech MedAI API server shutting down...")
 
+    try:
+        from agent.graph import close_mcp_clients
+        from agent.mcp.adapters.connection_pool import close_shared_connector
+
+        await close_mcp_clients()
+        await close_shared_connector()
+    except Exception as e:
+        logger.error("❌ MCP client shutdown failed: %s", e)
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -227,7 +236,7 @@ async def add_process_time_header(request: Request, call_next):
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions with proper logging."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
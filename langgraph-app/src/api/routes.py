@@ -60,9 +60,9 @@ async def health_check() -> HealthCheckResponse:
 
     # Check SÚKL MCP client
     try:
-        from agent.graph import _sukl_client
+        from agent.graph import get_sukl_client
 
-        if _sukl_client is not None:
+        if get_sukl_client() is not None:
             mcp_status["sukl"] = "available"
             logger.debug("SÚKL MCP client: available")
         else:
@@ -78,9 +78,9 @@ async def health_check() -> HealthCheckResponse:
 
     # Check BioMCP client
     try:
-        from agent.graph import _biomcp_client
+        from agent.graph import get_biomcp_client
 
-        if _biomcp_client is not None:
+        if get_biomcp_client() is not None:
             mcp_status["biomcp"] = "available"
             logger.debug("BioMCP client: available")
         else:
@@ -193,8 +193,8 @@ async def consult_stream_generator(
     start_time = time.time()
 
     try:
-        # Get MCP clients from module-level instances
-        from agent.graph import _biomcp_client, _sukl_client
+        # Get shared MCP clients (created on first use)
+        from agent.graph import get_biomcp_client, get_sukl_client
 
         # Build context with all required fields including MCP clients
         context: Context = {
@@ -202,8 +202,8 @@ async def consult_stream_generator(
             "temperature": 0.0,
             "mode": mode,
             "user_id": user_id,
-            "sukl_mcp_client": _sukl_client,
-            "biomcp_client": _biomcp_client,
+            "sukl_mcp_client": get_sukl_client(),
+            "biomcp_client": get_biomcp_client(),
         }
 
         # Wrap graph execution in timeout (30s)
@@ -79,6 +79,35 @@ class TestAddDocumentsReducer:
         result = add_documents(existing, new)
 
         assert len(result) == 1
+        assert result is existing
+
+    def test_does_not_mutate_existing(self) -> None:
+        """Test existing list is left untouched when documents are appended."""
+        existing = [Document(page_content="doc1", metadata={"source": "sukl"})]
+        new = [Document(page_content="doc2", metadata={"source": "pubmed"})]
+
+        result = add_documents(existing, new)
+
+        assert len(result) == 2
+        assert len(existing) == 1
+
+    def test_skips_duplicate_documents(self) -> None:
+        """Test documents with the same source and content are added once."""
+        existing = [Document(page_content="doc1", metadata={"source": "sukl"})]
+        new = [
+            Document(page_content="doc1", metadata={"source": "sukl"}),
+            Document(page_content="doc1", metadata={"source": "PubMed"}),
+            Document(page_content="doc2", metadata={"source": "PubMed"}),
+            Document(page_content="doc2", metadata={"source": "PubMed"}),
+        ]
+
+        result = add_documents(existing, new)
+
+        assert [(d.metadata["source"], d.page_content) for d in result] == [
+            ("sukl", "doc1"),
+            ("PubMed", "doc1"),
+            ("PubMed", "doc2"),
+        ]
 
     def test_both_empty(self) -> None:
         """Test appending empty to empty."""
@@ -40,6 +40,12 @@ class TestGenerateCacheKey:
         key2 = generate_cache_key("ibuprofen", "quick")
         assert key1 != key2
 
+    def test_whitespace_and_case_variants_share_key(self):
+        """Queries differing only in spacing or case map to the same key."""
+        key1 = generate_cache_key("Dávkování metforminu", "quick")
+        key2 = generate_cache_key("  dávkování   METFORMINU\n", "quick")
+        assert key1 == key2
+
     def test_different_modes_different_keys(self):
         """Same query with different modes must produce different keys."""
         key1 = generate_cache_key("test", "quick")
@@ -124,7 +124,12 @@ class TestHealthEndpointSanitization:
             patch("api.routes.settings", prod_settings),
             patch.dict(
                 "sys.modules",
-                {"agent.graph": MagicMock(_sukl_client=None, _biomcp_client=None)},
+                {
+                    "agent.graph": MagicMock(
+                        get_sukl_client=MagicMock(return_value=None),
+                        get_biomcp_client=MagicMock(return_value=None),
+                    )
+                },
             ),
             patch("api.routes.get_pool", new_callable=AsyncMock) as mock_pool,
         ):
@@ -158,7 +163,12 @@ class TestHealthEndpointSanitization:
             patch("api.routes.settings", prod_settings),
             patch.dict(
                 "sys.modules",
-                {"agent.graph": MagicMock(_sukl_client=None, _biomcp_client=None)},
+                {
+                    "agent.graph": MagicMock(
+                        get_sukl_client=MagicMock(return_value=None),
+                        get_biomcp_client=MagicMock(return_value=None),
+                    )
+                },
             ),
             patch("api.routes.get_pool", side_effect=OSError("Connection refused")),
         ):
@@ -181,7 +191,12 @@ class TestHealthEndpointSanitization:
             patch("api.routes.settings", dev_settings),
             patch.dict(
                 "sys.modules",
-                {"agent.graph": MagicMock(_sukl_client=None, _biomcp_client=None)},
+                {
+                    "agent.graph": MagicMock(
+                        get_sukl_client=MagicMock(return_value=None),
+                        get_biomcp_client=MagicMock(return_value=None),
+                    )
+                },
             ),
             patch("api.routes.get_pool", side_effect=OSError("Connection refused")),
         ):
@@ -5,14 +5,23 @@ Tests use aioresponses to mock HTTP calls without real BioMCP Docker server.
 
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import patch
+
 import aiohttp
 import pytest
 from aioresponses import aioresponses
 
-from agent.mcp.adapters.biomcp_client import BioMCPClient
+from agent.mcp.adapters.biomcp_client import ERROR_BODY_LIMIT, BioMCPClient
+from agent.mcp.adapters.circuit_breaker import CircuitBreaker
+from agent.mcp.adapters.retry_strategy import TenacityRetryStrategy
+from agent.mcp.domain.entities import RetryConfig
 from agent.mcp.domain.exceptions import (
+    MCPCircuitOpenError,
     MCPConnectionError,
+    MCPServerError,
     MCPTimeoutError,
+    MCPValidationError,
 )
 
 
@@ -60,6 +69,31 @@ class TestBioMCPClientInitialization:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_own_session_uses_tuned_connector(self):
+        """Test client-owned session gets a keep-alive pool with DNS cache."""
+        client = BioMCPClient(connector_limit_per_host=8, dns_cache_ttl=60)
+
+        session = await client._get_session()
+        connector = session.connector
+
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit_per_host == 8
+        assert connector.use_dns_cache
+
+        await client.close()
+        assert connector.closed
+
+    @pytest.mark.asyncio
+    async def test_context_manager_opens_and_closes_session(self):
+        """Test async with opens the session on entry and closes it on exit."""
+        async with BioMCPClient() as client:
+            session = client._session
+            assert session is not None
+            assert not session.closed
+
+        assert session.closed
+
 
 class TestBioMCPClientCallTool:
     """Test BioMCPClient.call_tool method."""
@@ -129,6 +163,24 @@ class TestBioMCPClientCallTool:
 
             await client.close()
 
+    @pytest.mark.asyncio
+    async def test_call_tool_error_body_is_truncated(self):
+        """Test a huge 4xx error page is read only up to the size cap."""
+        with aioresponses() as m:
+            m.post(
+                "http://localhost:8080/tools/test_tool",
+                status=404,
+                body="x" * (ERROR_BODY_LIMIT * 4),
+            )
+
+            client = BioMCPClient()
+            response = await client.call_tool("test_tool", {})
+
+            assert response.success is False
+            assert len(response.error) <= ERROR_BODY_LIMIT + len("HTTP 404: ")
+
+            await client.close()
+
 
 class TestBioMCPClientHealthCheck:
     """Test BioMCPClient.health_check method."""
@@ -207,6 +259,22 @@ class TestBioMCPClientTypedHelpers:
 
             await client.close()
 
+    @pytest.mark.asyncio
+    async def test_search_articles_invalid_article_raises(self):
+        """Test an article missing required fields raises MCPValidationError."""
+        with aioresponses() as m:
+            m.post(
+                "http://localhost:8080/tools/article_searcher",
+                payload={"articles": [{"pmid": "1", "title": "Ok"}, {"pmid": "2"}]},
+                status=200,
+            )
+
+            client = BioMCPClient()
+            with pytest.raises(MCPValidationError):
+                await client.search_articles("test query")
+
+            await client.close()
+
     @pytest.mark.asyncio
     async def test_search_articles_with_max_results(self):
         """Test search_articles respects max_results parameter."""
@@ -322,3 +390,270 @@ class TestBioMCPClientClose:
         await client.close()
 
         assert session.closed
+
+
+class TestBioMCPClientResponseCache:
+    """Test BioMCPClient in-process response cache."""
+
+    URL = "http://localhost:8080/tools/article_searcher"
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_hit_cache(self):
+        """Test a repeated call is served without a second request."""
+        with aioresponses() as m:
+            m.post(self.URL, payload={"articles": []}, status=200)
+
+            client = BioMCPClient(cache_ttl=60)
+            first = await client.call_tool("article_searcher", {"query": "a", "n": 1})
+            second = await client.call_tool("article_searcher", {"n": 1, "query": "a"})
+
+            assert second == first
+            assert len(next(iter(m.requests.values()))) == 1
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_isolated_copies(self):
+        """Test mutating a returned response does not change later hits."""
+        with aioresponses() as m:
+            m.post(self.URL, payload={"articles": [{"pmid": "1"}]}, status=200)
+
+            client = BioMCPClient(cache_ttl=60)
+            first = await client.call_tool("article_searcher", {"query": "a"})
+            first.data["articles"].clear()
+            second = await client.call_tool("article_searcher", {"query": "a"})
+            second.metadata["tool_name"] = "changed"
+            third = await client.call_tool("article_searcher", {"query": "a"})
+
+            assert third.data == {"articles": [{"pmid": "1"}]}
+            assert third.metadata["tool_name"] == "article_searcher"
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_non_json_parameters_skip_cache(self):
+        """Test parameters without a canonical JSON key never touch the cache."""
+        client = BioMCPClient(cache_ttl=60)
+
+        with (
+            patch.object(client, "_cache_get") as cache_get,
+            aioresponses() as m,
+        ):
+            m.post(self.URL, payload={"articles": []}, status=200, repeat=True)
+            for _ in range(2):
+                await client.call_tool("article_searcher", {"query": {"a", "b"}})
+
+            assert len(next(iter(m.requests.values()))) == 2
+
+        cache_get.assert_not_called()
+        assert len(client._response_cache) == 0
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bypass_and_failures_skip_cache(self):
+        """Test cache_bypass forces a request and failures are not cached."""
+        with aioresponses() as m:
+            m.post(self.URL, status=404, body="not found")
+            m.post(self.URL, payload={"articles": []}, status=200)
+            m.post(self.URL, payload={"articles": []}, status=200)
+
+            client = BioMCPClient(cache_ttl=60)
+            failed = await client.call_tool("article_searcher", {"query": "a"})
+            ok = await client.call_tool("article_searcher", {"query": "a"})
+            fresh = await client.call_tool(
+                "article_searcher", {"query": "a"}, cache_bypass=True
+            )
+
+            assert not failed.success
+            assert ok.success
+            assert fresh is not ok
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self):
+        """Test clients without cache_ttl always call the server."""
+        with aioresponses() as m:
+            m.post(self.URL, payload={"articles": []}, status=200, repeat=True)
+
+            client = BioMCPClient()
+            await client.call_tool("article_searcher", {"query": "a"})
+            await client.call_tool("article_searcher", {"query": "a"})
+
+            assert len(next(iter(m.requests.values()))) == 2
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        """Test expired entries are fetched again."""
+        with aioresponses() as m:
+            m.post(self.URL, payload={"articles": []}, status=200, repeat=True)
+
+            client = BioMCPClient(cache_ttl=10)
+            clock = "agent.mcp.adapters.biomcp_client.time.monotonic"
+            with patch(clock, return_value=100.0):
+                first = await client.call_tool("article_searcher", {"query": "a"})
+            with patch(clock, return_value=110.0):
+                second = await client.call_tool("article_searcher", {"query": "a"})
+
+            assert first.success and second.success
+            assert len(next(iter(m.requests.values()))) == 2
+
+            await client.close()
+
+
+class TestBioMCPClientCircuitBreaker:
+    """Test BioMCPClient fail-fast behaviour with a circuit breaker."""
+
+    URL = "http://localhost:8080/tools/article_searcher"
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test repeated server errors open the circuit and skip requests."""
+        with aioresponses() as m:
+            m.post(self.URL, status=503, body="unavailable", repeat=True)
+
+            client = BioMCPClient(circuit_breaker=CircuitBreaker(fail_threshold=2))
+            for _ in range(2):
+                with pytest.raises(MCPServerError):
+                    await client.call_tool("article_searcher", {"query": "a"})
+
+            with pytest.raises(MCPConnectionError, match="circuit open"):
+                await client.call_tool("article_searcher", {"query": "a"})
+            assert len(next(iter(m.requests.values()))) == 2
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_stop_once_circuit_opens(self):
+        """Test each retry attempt is gated by the breaker."""
+        with aioresponses() as m:
+            m.post(self.URL, status=503, body="unavailable", repeat=True)
+
+            client = BioMCPClient(
+                retry_strategy=TenacityRetryStrategy(),
+                default_retry_config=RetryConfig(
+                    max_retries=5, base_delay=0.001, jitter=False
+                ),
+                circuit_breaker=CircuitBreaker(fail_threshold=2),
+            )
+            with pytest.raises(MCPCircuitOpenError):
+                await client.call_tool("article_searcher", {"query": "a"})
+            assert len(next(iter(m.requests.values()))) == 2
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_permanent_server_errors_do_not_open_circuit(self):
+        """Test non-transient 5xx (e.g. 501) are not breaker failures."""
+        with aioresponses() as m:
+            m.post(self.URL, status=501, body="not implemented", repeat=True)
+
+            breaker = CircuitBreaker(fail_threshold=1)
+            client = BioMCPClient(circuit_breaker=breaker)
+            for _ in range(2):
+                with pytest.raises(MCPServerError):
+                    await client.call_tool("article_searcher", {"query": "a"})
+            assert breaker.state == "closed"
+
+            await client.close()
+
+
+class TestBioMCPClientBulkhead:
+    """Test BioMCPClient bound on concurrent in-flight requests."""
+
+    URL = "http://localhost:8080/tools/article_searcher"
+
+    def test_invalid_max_concurrency_raises(self):
+        """Test max_concurrency must allow at least one request."""
+        with pytest.raises(ValueError):
+            BioMCPClient(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_bounded(self):
+        """Test no more than max_concurrency requests run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_response(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with aioresponses() as m:
+            m.post(
+                self.URL,
+                payload={"articles": []},
+                callback=slow_response,
+                repeat=True,
+            )
+
+            client = BioMCPClient(max_concurrency=2)
+            responses = await asyncio.gather(
+                *(
+                    client.call_tool("article_searcher", {"query": str(i)})
+                    for i in range(6)
+                )
+            )
+
+            assert all(response.success for response in responses)
+            assert peak == 2
+
+            await client.close()
+
+
+class TestBioMCPClientBatch:
+    """Test BioMCPClient concurrent batch helpers."""
+
+    @pytest.mark.asyncio
+    async def test_search_articles_batch_keeps_order_and_captures_errors(self):
+        """Test results follow input order and failures are returned, not raised."""
+        with aioresponses() as m:
+            url = "http://localhost:8080/tools/article_searcher"
+            m.post(
+                url,
+                payload={"articles": [{"pmid": "1", "title": "First"}]},
+                status=200,
+            )
+            m.post(url, status=404, body="not found")
+
+            client = BioMCPClient()
+            results = await client.search_articles_batch(["a", "b"], concurrency=1)
+
+            assert results[0][0].pmid == "1"
+            assert isinstance(results[1], MCPValidationError)
+
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_limits_requests_in_flight(self):
+        """Test no more than `concurrency` requests run at once."""
+        client = BioMCPClient()
+        in_flight = peak = 0
+
+        async def fake_full_text(pmid: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"text-{pmid}"
+
+        with patch.object(client, "get_full_text", fake_full_text):
+            results = await client.get_full_text_batch(
+                [str(i) for i in range(6)], concurrency=2
+            )
+
+        assert results == [f"text-{i}" for i in range(6)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_invalid_concurrency(self):
+        """Test concurrency below 1 raises ValueError."""
+        client = BioMCPClient()
+        with pytest.raises(ValueError):
+            await client.search_trials_batch(["q"], concurrency=0)
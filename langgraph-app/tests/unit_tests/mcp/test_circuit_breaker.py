@@ -0,0 +1,46 @@
+"""Unit tests for the MCP circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agent.mcp.adapters.circuit_breaker import CircuitBreaker
+
+MONOTONIC = "agent.mcp.adapters.circuit_breaker.time.monotonic"
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(fail_threshold=2, recovery_timeout=10)
+    with patch(MONOTONIC, return_value=100.0):
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(fail_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(fail_threshold=1, recovery_timeout=10)
+    with patch(MONOTONIC, return_value=100.0):
+        breaker.record_failure()
+    with patch(MONOTONIC, return_value=110.0):
+        assert breaker.state == "half_open"
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_invalid_parameters_raise():
+    with pytest.raises(ValueError):
+        CircuitBreaker(fail_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(recovery_timeout=0)
@@ -47,6 +47,12 @@ class TestMCPConfigDefaults:
             config = MCPConfig.from_env()
             assert config.biomcp_max_results == 10
 
+    def test_default_biomcp_cache_ttl(self):
+        """Test default BioMCP response cache TTL."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = MCPConfig.from_env()
+            assert config.biomcp_cache_ttl == 300.0
+
     def test_default_retry_config(self):
         """Test default retry configuration."""
         with patch.dict(os.environ, {}, clear=True):
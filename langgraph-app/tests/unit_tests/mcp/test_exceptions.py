@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from agent.mcp.domain.exceptions import (
+    MCPCircuitOpenError,
     MCPConnectionError,
     MCPError,
     MCPServerError,
@@ -59,6 +60,17 @@ class TestMCPConnectionError:
         assert isinstance(error, Exception)
 
 
+class TestMCPCircuitOpenError:
+    """Test MCPCircuitOpenError exception."""
+
+    def test_circuit_open_error_is_connection_error(self):
+        """Test callers handling MCPConnectionError also catch an open circuit."""
+        error = MCPCircuitOpenError("Circuit open", server_url="http://localhost")
+
+        assert isinstance(error, MCPConnectionError)
+        assert error.server_url == "http://localhost"
+
+
 class TestMCPTimeoutError:
     """Test MCPTimeoutError exception."""
 
@@ -6,11 +6,18 @@ Following TDD - tests written BEFORE implementation.
 
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 
-from agent.mcp.adapters.retry_strategy import TenacityRetryStrategy
+from agent.mcp.adapters.retry_strategy import (
+    TenacityRetryStrategy,
+    parse_retry_after,
+)
 from agent.mcp.domain.entities import RetryConfig
 from agent.mcp.domain.exceptions import (
+    MCPCircuitOpenError,
     MCPConnectionError,
     MCPServerError,
     MCPTimeoutError,
@@ -191,6 +198,43 @@ class TestTenacityRetryStrategyNonRetryableErrors:
 
         assert call_count == 1  # No retries
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [501, 505])
+    async def test_permanent_server_error_not_retried(self, status_code):
+        """Test that 5xx codes which cannot recover are NOT retried."""
+        strategy = TenacityRetryStrategy()
+        config = RetryConfig(max_retries=3, base_delay=0.01)
+
+        call_count = 0
+
+        async def not_implemented_operation():
+            nonlocal call_count
+            call_count += 1
+            raise MCPServerError("Not implemented", status_code=status_code)
+
+        with pytest.raises(MCPServerError):
+            await strategy.execute_with_retry(not_implemented_operation, config)
+
+        assert call_count == 1  # No retries
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_error_not_retried(self):
+        """Test that an open circuit breaker is NOT retried."""
+        strategy = TenacityRetryStrategy()
+        config = RetryConfig(max_retries=3, base_delay=0.01)
+
+        call_count = 0
+
+        async def circuit_open_operation():
+            nonlocal call_count
+            call_count += 1
+            raise MCPCircuitOpenError("Circuit open")
+
+        with pytest.raises(MCPCircuitOpenError):
+            await strategy.execute_with_retry(circuit_open_operation, config)
+
+        assert call_count == 1  # No retries
+
     @pytest.mark.asyncio
     async def test_generic_exception_not_retried(self):
         """Test that generic exceptions are NOT retried."""
@@ -286,6 +330,34 @@ class TestTenacityRetryStrategyWaitBehavior:
             # Jitter should cause variation, but test is lenient
             assert len(unique_delays) >= 1
 
+    def test_jitter_draws_wait_up_to_exponential_delay(self):
+        """Test full jitter keeps each wait between zero and the backoff delay."""
+        strategy = TenacityRetryStrategy()
+        config = RetryConfig(base_delay=1.0, max_delay=30.0, jitter=True)
+        wait = strategy._build_wait_strategy(config)
+        retry_state = MagicMock(attempt_number=3)
+
+        delays = [wait(retry_state) for _ in range(50)]
+
+        assert all(0.0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_rate_limit_waits_retry_after_capped_at_max_delay(self):
+        """Test a 429 Retry-After replaces the backoff, up to max_delay."""
+        strategy = TenacityRetryStrategy()
+        wait = strategy._build_wait_strategy(RetryConfig(base_delay=1.0, max_delay=10))
+        retry_state = MagicMock(attempt_number=1)
+
+        retry_state.outcome.exception.return_value = MCPTimeoutError(
+            "Rate limited", retry_after=3.0
+        )
+        assert wait(retry_state) == 3.0
+
+        retry_state.outcome.exception.return_value = MCPTimeoutError(
+            "Rate limited", retry_after=120.0
+        )
+        assert wait(retry_state) == 10
+
     @pytest.mark.asyncio
     async def test_max_delay_caps_wait_time(self):
         """Test that max_delay caps the exponential backoff."""
@@ -375,3 +447,54 @@ class TestTenacityRetryStrategyEdgeCases:
             await strategy.execute_with_retry(operation_with_context, config)
 
         assert exc_info.value.server_url == "http://test.example.com"
+
+    @pytest.mark.asyncio
+    async def test_engine_reused_for_equal_configs(self):
+        """Test one retry engine is built per distinct configuration."""
+        strategy = TenacityRetryStrategy()
+
+        async def operation():
+            return "ok"
+
+        await strategy.execute_with_retry(operation, RetryConfig(base_delay=0.01))
+        await strategy.execute_with_retry(operation, RetryConfig(base_delay=0.01))
+        assert len(strategy._engines) == 1
+
+        await strategy.execute_with_retry(operation, RetryConfig(base_delay=0.02))
+        assert len(strategy._engines) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_retry_independently(self):
+        """Test concurrent calls sharing an engine keep separate attempt counts."""
+        strategy = TenacityRetryStrategy()
+        config = RetryConfig(max_retries=1, base_delay=0.01, jitter=False)
+        attempts = {"a": 0, "b": 0}
+
+        async def fails_once(name: str) -> str:
+            attempts[name] += 1
+            await asyncio.sleep(0)
+            if attempts[name] == 1:
+                raise MCPConnectionError("Fail")
+            return name
+
+        results = await asyncio.gather(
+            strategy.execute_with_retry(lambda: fails_once("a"), config),
+            strategy.execute_with_retry(lambda: fails_once("b"), config),
+        )
+
+        assert results == ["a", "b"]
+        assert attempts == {"a": 2, "b": 2}
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after("30") == 30.0
+
+    def test_http_date_in_past_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid_returns_none(self, value):
+        assert parse_retry_after(value) is None
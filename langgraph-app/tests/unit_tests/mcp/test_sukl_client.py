@@ -66,6 +66,26 @@ class TestSUKLMCPClientInitialization:
         assert session1 is session2
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_shared_connector_outlives_client_session(self):
+        from agent.mcp import BioMCPClient
+        from agent.mcp.adapters.connection_pool import close_shared_connector
+
+        sukl = SUKLMCPClient(base_url=BASE_URL, share_connector=True)
+        biomcp = BioMCPClient(base_url="http://localhost:8080", share_connector=True)
+        sukl_session = await sukl._get_session()
+        biomcp_session = await biomcp._get_session()
+        connector = sukl_session.connector
+        assert connector is not None
+        assert biomcp_session.connector is connector
+
+        await sukl.close()
+        assert not connector.closed
+
+        await biomcp.close()
+        await close_shared_connector()
+        assert connector.closed
+
 
 class TestSUKLMCPClientCallTool:
     """Test SUKLMCPClient.call_tool with JSON-RPC protocol."""
@@ -145,8 +165,9 @@ class TestSUKLMCPClientCallTool:
             m.post(BASE_URL, status=429, headers={"Retry-After": "30"})
 
             client = SUKLMCPClient(base_url=BASE_URL)
-            with pytest.raises(MCPTimeoutError, match="Rate limited"):
+            with pytest.raises(MCPTimeoutError, match="Rate limited") as exc_info:
                 await client.call_tool("search_drugs", {"query": "test"})
+            assert exc_info.value.retry_after == 30.0
             await client.close()
 
     @pytest.mark.asyncio
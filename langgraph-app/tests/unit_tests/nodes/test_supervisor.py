@@ -345,6 +345,40 @@ class TestEdgeCases:
         assert result.confidence < 0.7  # Lower confidence for fallback
         assert "Fallback" in result.reasoning
 
+    @pytest.mark.asyncio
+    async def test_classification_cache_skips_repeated_llm_call(
+        self, mock_llm: MagicMock, create_mock_tool_call
+    ):
+        """Test cached classification is reused for a repeated query."""
+        from agent.utils.response_cache import ResponseCache
+
+        classifier = IntentClassifier(llm=mock_llm, cache=ResponseCache())
+        mock_llm.ainvoke.return_value = create_mock_tool_call(
+            intent_type="drug_info",
+            confidence=0.95,
+            agents_to_call=["drug_agent"],
+            reasoning="Query asks about drug composition",
+        )
+
+        first = await classifier.classify_intent("Jaké je složení Ibalginu?")
+        second = await classifier.classify_intent("  jaké je složení ibalginu? ")
+
+        assert mock_llm.ainvoke.await_count == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_classification_cache_ignores_fallback(self, mock_llm: MagicMock):
+        """Test keyword fallback results are not cached."""
+        from agent.utils.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        classifier = IntentClassifier(llm=mock_llm, cache=cache)
+        mock_llm.ainvoke.side_effect = Exception("API error")
+
+        await classifier.classify_intent("Najdi lék Ibalgin")
+
+        assert len(cache) == 0
+
     @pytest.mark.asyncio
     async def test_fallback_on_no_tool_calls(self, mock_llm: MagicMock):
         """Test fallback when response has no tool calls."""
@@ -448,6 +482,18 @@ class TestHelperFunctions:
         assert "guidelines_agent" in result.agents_to_call
         assert "Fallback" in result.reasoning
 
+    def test_fallback_to_keyword_routing_compound(self):
+        """Test keyword fallback calls every matching agent in priority order."""
+        result = fallback_to_keyword_routing("Studie a guidelines o dávkování léku")
+
+        assert result.intent_type == IntentType.COMPOUND_QUERY
+        assert result.agents_to_call == [
+            "drug_agent",
+            "pubmed_agent",
+            "guidelines_agent",
+        ]
+        assert "Fallback" in result.reasoning
+
     def test_fallback_to_keyword_routing_general(self):
         """Test keyword fallback for general query (no keywords)."""
         result = fallback_to_keyword_routing("Zdravím vás")
@@ -614,6 +660,18 @@ class TestExtractMessageContent:
         message = {"role": "user", "content": [{"type": "text", "text": "Hello dict"}]}
         assert extract_message_content(message) == "Hello dict"
 
+    def test_extract_from_multimodal_list_joins_text_blocks(self):
+        """Test all text blocks are joined and non-text blocks skipped."""
+        message = {
+            "role": "user",
+            "content": [
+                {"type": "image_url", "image_url": {"url": "data:image/png;base64"}},
+                {"type": "text", "text": "Popis snímku."},
+                "Jaký lék zvolit?",
+            ],
+        }
+        assert extract_message_content(message) == "Popis snímku. Jaký lék zvolit?"
+
     def test_extract_empty_content(self):
         """Test extracting from empty content."""
         message = {"role": "user", "content": ""}
@@ -799,10 +857,35 @@ class TestSupervisorNode:
 
             result = await supervisor_node(state, mock_runtime)
 
-            # Fallback to route_query: "lék" is a drug keyword → drug_agent
+            # Keyword fallback: "lék" is a drug keyword → drug_agent
             assert isinstance(result, Send)
             assert result.node == "drug_agent"
 
+    @pytest.mark.asyncio
+    async def test_supervisor_node_classification_error_fallback_fans_out(
+        self, mock_runtime
+    ):
+        """Test keyword fallback sends to every matching agent in parallel."""
+        state = State(
+            messages=[{"role": "user", "content": "Guidelines k dávkování léku"}],
+            retrieved_docs=[],
+        )
+
+        with patch("agent.nodes.supervisor.IntentClassifier") as mock_cls:
+            mock_classifier = MagicMock()
+            mock_classifier.classify_intent = AsyncMock(
+                side_effect=Exception("API error")
+            )
+            mock_cls.return_value = mock_classifier
+
+            result = await supervisor_node(state, mock_runtime)
+
+            assert isinstance(result, list)
+            assert [send.node for send in result] == [
+                "drug_agent",
+                "guidelines_agent",
+            ]
+
     @pytest.mark.asyncio
     async def test_supervisor_node_explicit_drug_query(self, mock_runtime):
         """Test supervisor routes explicit drug_query directly via Send."""
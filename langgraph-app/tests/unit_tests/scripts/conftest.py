@@ -0,0 +1,7 @@
+"""Make the ingestion scripts importable in their own test package."""
+
+import sys
+from pathlib import Path
+
+# The scripts import each other as top-level modules (e.g. _embedding_cache)
+sys.path.insert(0, str(Path(__file__).parents[3] / "scripts"))
@@ -0,0 +1,113 @@
+"""Unit tests for the ingestion embedding cache."""
+
+import sqlite3
+from array import array
+
+import pytest
+from _embedding_cache import EmbeddingCache, embedding_key
+
+MODEL = "text-embedding-ada-002"
+
+
+def _words(start: int, stop: int) -> str:
+    return " ".join(f"slovo{i}" for i in range(start, stop))
+
+
+def test_get_many_returns_exact_hits_by_index(tmp_path):
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        cache.put_many(MODEL, ["hypertenze", "diabetes"], [[1.0, 2.0], [3.0, 4.0]])
+
+        hits = cache.get_many(MODEL, ["astma", "diabetes", "hypertenze"])
+
+    assert hits == {1: [3.0, 4.0], 2: [1.0, 2.0]}
+
+
+def test_get_many_misses_other_model(tmp_path):
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        cache.put_many(MODEL, ["hypertenze"], [[1.0, 2.0]])
+
+        assert cache.get_many("other-model", ["hypertenze"]) == {}
+
+
+def test_entries_persist_across_connections(tmp_path):
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        cache.put_many(MODEL, ["hypertenze"], [[0.5, -0.25]])
+
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        assert cache.get_many(MODEL, ["hypertenze"]) == {0: [0.5, -0.25]}
+
+
+def test_fuzzy_reuse_above_threshold(tmp_path):
+    original = _words(0, 200)
+    # Only the last word differs: estimated Jaccard close to 1
+    republished = _words(0, 199) + " konec"
+
+    with EmbeddingCache(tmp_path / "cache.db", fuzzy_threshold=0.9) as cache:
+        cache.put_many(MODEL, [original], [[1.0, 2.0]])
+
+        assert cache.get_many(MODEL, [republished]) == {0: [1.0, 2.0]}
+
+
+def test_fuzzy_reuse_below_threshold_is_a_miss(tmp_path):
+    original = _words(0, 200)
+    # Half of the shingles differ: estimated Jaccard about 1/3
+    different = _words(100, 300)
+
+    with EmbeddingCache(tmp_path / "cache.db", fuzzy_threshold=0.9) as cache:
+        cache.put_many(MODEL, [original], [[1.0, 2.0]])
+
+        assert cache.get_many(MODEL, [different]) == {}
+
+
+def test_fuzzy_reuse_disabled_by_default(tmp_path):
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        cache.put_many(MODEL, [_words(0, 200)], [[1.0, 2.0]])
+
+        assert cache.get_many(MODEL, [_words(0, 199) + " konec"]) == {}
+
+
+@pytest.mark.parametrize("threshold", [0, -0.5, 1.5])
+def test_invalid_fuzzy_threshold_raises(tmp_path, threshold):
+    with pytest.raises(ValueError, match="fuzzy_threshold"):
+        EmbeddingCache(tmp_path / "cache.db", fuzzy_threshold=threshold)
+
+
+def test_put_many_rejects_misaligned_embeddings(tmp_path):
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        with pytest.raises(ValueError, match="2 texts but 1 embeddings"):
+            cache.put_many(MODEL, ["a", "b"], [[1.0]])
+
+
+def test_vectors_keep_their_own_dimension(tmp_path):
+    with EmbeddingCache(tmp_path / "cache.db") as cache:
+        cache.put_many(MODEL, ["short", "long"], [[1.0], [1.0, 2.0, 3.0]])
+
+        hits = cache.get_many(MODEL, ["short", "long"])
+        dims = dict(cache._conn.execute("SELECT hash, dim FROM embedding_cache"))
+
+    assert hits == {0: [1.0], 1: [1.0, 2.0, 3.0]}
+    assert dims == {embedding_key(MODEL, "short"): 1, embedding_key(MODEL, "long"): 3}
+
+
+def test_opens_database_without_minhash_column(tmp_path):
+    # Schema written before near-duplicate support was added
+    path = tmp_path / "cache.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE embedding_cache ("
+        "hash BLOB PRIMARY KEY, dim INTEGER NOT NULL, vec BLOB NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO embedding_cache VALUES (?, ?, ?)",
+        (embedding_key(MODEL, "hypertenze"), 2, array("f", [1.0, 2.0]).tobytes()),
+    )
+    conn.commit()
+    conn.close()
+
+    with EmbeddingCache(path, fuzzy_threshold=0.9) as cache:
+        assert cache.get_many(MODEL, ["hypertenze"]) == {0: [1.0, 2.0]}
+        # Old rows have no signature, so they are never fuzzy candidates
+        assert cache.get_many(MODEL, ["hypertenze znovu"]) == {}
+
+        cache.put_many(MODEL, [_words(0, 200)], [[3.0, 4.0]])
+        assert cache.get_many(MODEL, [_words(0, 199) + " konec"]) == {0: [3.0, 4.0]}
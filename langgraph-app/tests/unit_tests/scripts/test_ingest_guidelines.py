@@ -0,0 +1,85 @@
+"""Unit tests for the guideline ingestion script."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from ingest_guidelines import (
+    _embed_in_batches,
+    _embed_with_cache,
+    _write_sections_json,
+    ingest_directory,
+    load_sections_json,
+)
+
+from agent.models.guideline_models import GuidelineSection, GuidelineSource
+
+
+def _section(index: int, embedding: list[float] | None) -> GuidelineSection:
+    metadata = {"chunk_index": index}
+    if embedding is not None:
+        metadata["embedding"] = embedding
+    return GuidelineSection(
+        guideline_id="CLS-JEP-2024-001",
+        title="Doporučené postupy pro hypertenzi",
+        section_name=f"Léčba (Part {index + 1}/3)",
+        content=f"Obsah části {index}",
+        publication_date="2024-01-15",
+        source=GuidelineSource.CLS_JEP,
+        url="https://www.cls.cz/guidelines/hypertenze-2024.pdf",
+        metadata=metadata,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"concurrency": 0},
+        {"concurrency": -1},
+        {"embedding_batch_size": 0},
+    ],
+)
+async def test_ingest_directory_rejects_invalid_limits(tmp_path, options):
+    with pytest.raises(ValueError, match="must be >= 1"):
+        await ingest_directory(
+            str(tmp_path), str(tmp_path / "metadata.csv"), str(tmp_path), **options
+        )
+
+
+@pytest.mark.asyncio
+async def test_embed_in_batches_closes_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+
+    async def fake_create_embeddings(batch, **kwargs):
+        return [[float(len(text))] for text in batch]
+
+    with (
+        patch("openai.AsyncOpenAI", return_value=client),
+        patch("ingest_guidelines.create_embeddings", new=fake_create_embeddings),
+    ):
+        embeddings = await _embed_in_batches(["a", "bb", "ccc"], batch_size=2)
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    client.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_embedding_empty_chunk_list_raises():
+    with pytest.raises(ValueError, match="cannot be empty"):
+        await _embed_with_cache([], batch_size=2, cache=None)
+
+
+@pytest.mark.parametrize("embeddings_sidecar", [False, True])
+def test_sections_json_round_trip(tmp_path, embeddings_sidecar):
+    # float32-exact values, so the sidecar round trip is lossless
+    sections = [_section(0, [0.5, -1.25]), _section(1, None), _section(2, [2.0, 0.0])]
+    output = tmp_path / "CLS-JEP-2024-001.json"
+
+    _write_sections_json(str(output), sections, embeddings_sidecar)
+
+    assert (tmp_path / "CLS-JEP-2024-001.emb.f32").exists() == embeddings_sidecar
+    assert ("embedding_ref" in output.read_text()) == embeddings_sidecar
+    assert load_sections_json(str(output)) == sections
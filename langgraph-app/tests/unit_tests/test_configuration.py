@@ -1,5 +1,8 @@
 """Tests for graph configuration and structure."""
 
+import os
+from unittest.mock import patch
+
 from langgraph.pregel import Pregel
 
 from agent.graph import graph
@@ -23,3 +26,70 @@ def test_graph_has_expected_nodes() -> None:
     }
     missing = expected - node_names
     assert not missing, f"Missing nodes: {missing}"
+
+
+def test_graph_entry_routes_explicit_queries_past_supervisor() -> None:
+    """__start__ can go straight to an agent or to the supervisor."""
+    start_targets = {
+        edge.target for edge in graph.get_graph().edges if edge.source == "__start__"
+    }
+    assert start_targets == {
+        "supervisor",
+        "drug_agent",
+        "pubmed_agent",
+        "guidelines_agent",
+    }
+
+
+def test_mcp_clients_are_created_once() -> None:
+    """Default MCP clients are lazily built singletons."""
+    from agent.graph import get_biomcp_client, get_sukl_client
+
+    assert get_sukl_client() is get_sukl_client()
+    assert get_biomcp_client() is get_biomcp_client()
+
+
+async def test_close_mcp_clients_resets_shared_clients() -> None:
+    """Closing the shared MCP clients drops them so the next call recreates them."""
+    from agent.graph import close_mcp_clients, get_sukl_client
+
+    client = get_sukl_client()
+    await close_mcp_clients()
+
+    assert get_sukl_client() is not client
+
+
+def test_default_mcp_clients_share_connection_pool() -> None:
+    """Default MCP clients open their sessions on the shared connector."""
+    from agent.graph import get_biomcp_client, get_sukl_client
+
+    sukl, biomcp = get_sukl_client(), get_biomcp_client()
+    assert sukl is not None and sukl.share_connector
+    assert biomcp is not None and biomcp.share_connector
+
+
+def test_tracing_disabled_without_langsmith_key() -> None:
+    """Without an API key, tracing env vars are explicitly set to "false"."""
+    from agent.graph import _init_environment
+
+    with patch.dict(os.environ), patch("agent.graph.load_dotenv"):
+        for name in ("LANGSMITH_API_KEY", "LANGSMITH_TRACING", "LANGCHAIN_TRACING_V2"):
+            os.environ.pop(name, None)
+
+        _init_environment.__wrapped__()
+
+        assert os.environ["LANGSMITH_TRACING"] == "false"
+        assert os.environ["LANGCHAIN_TRACING_V2"] == "false"
+
+
+def test_load_dotenv_can_be_disabled() -> None:
+    """LOAD_DOTENV=0 skips the .env lookup."""
+    from agent.graph import _init_environment
+
+    with (
+        patch.dict(os.environ, {"LOAD_DOTENV": "0"}),
+        patch("agent.graph.load_dotenv") as load_dotenv,
+    ):
+        _init_environment.__wrapped__()
+
+    load_dotenv.assert_not_called()
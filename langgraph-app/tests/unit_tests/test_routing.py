@@ -3,6 +3,8 @@
 Tests ensure route_query handles both string and list (multimodal) message content.
 """
 
+import re
+
 from agent.graph import State, route_query
 
 
@@ -54,7 +56,7 @@ def test_route_query_with_multimodal_simple_list():
 
     Acceptance: Given State with list of strings as content,
     When route_query is invoked,
-    Then it uses first string element for routing.
+    Then it uses the joined string elements for routing.
     """
     # Arrange
     state = State(
@@ -143,6 +145,25 @@ def test_route_query_with_explicit_drug_query():
     assert result == "drug_agent"
 
 
+def test_route_explicit_query_skips_supervisor_only_for_explicit_queries():
+    """Entry router sends pre-classified queries to their agent, else supervisor."""
+    from agent.graph import route_explicit_query
+    from agent.models.drug_models import DrugQuery
+
+    messages = [{"role": "user", "content": "dávkování ibuprofenu"}]
+
+    assert route_explicit_query(State(messages=messages)) == "supervisor"
+    assert (
+        route_explicit_query(
+            State(
+                messages=messages,
+                drug_query=DrugQuery(query_text="ibuprofen", query_type="search"),
+            )
+        )
+        == "drug_agent"
+    )
+
+
 def test_route_query_with_explicit_research_query():
     """Test route_query uses explicit research_query if set.
 
@@ -389,3 +410,139 @@ def test_route_query_drug_keyword_aspirin():
     )
     result = route_query(state)
     assert result == "drug_agent"  # "dávkování" is in DRUG_KEYWORDS
+
+
+def test_match_keyword_category_matches_substring_priority():
+    """Single-pass keyword matcher agrees with per-set substring checks."""
+    from agent.utils.keyword_routing import (
+        DRUG_KEYWORDS,
+        GUIDELINES_KEYWORDS,
+        RESEARCH_KEYWORDS,
+        match_keyword_categories,
+        match_keyword_category,
+        normalize_keyword_text,
+    )
+
+    def occurs(keyword: str, message: str) -> bool:
+        keyword = normalize_keyword_text(keyword)
+        if len(keyword) > 4:
+            return keyword in message
+        # Short keywords must start a word
+        return re.search(rf"(?<!\w){re.escape(keyword)}", message) is not None
+
+    def expected(message: str) -> tuple[str, ...]:
+        return tuple(
+            name
+            for name, keywords in [
+                ("drug", DRUG_KEYWORDS),
+                ("research", RESEARCH_KEYWORDS),
+                ("guidelines", GUIDELINES_KEYWORDS),
+            ]
+            if any(occurs(kw, message) for kw in keywords)
+        )
+
+    messages = [
+        "jaké je dávkování aspirinu",
+        "meta-analýza (2023) o hypertenzi",
+        "doporučené postupy cls jep",
+        "guidelines a studie, pak lék",
+        "esc doporučení a klinická studie",
+        "léčba hypertenze",
+        "",
+    ]
+    keywords = DRUG_KEYWORDS | RESEARCH_KEYWORDS | GUIDELINES_KEYWORDS
+    messages += [f"dotaz {keyword} konec" for keyword in keywords]
+    messages += [f"{a}{b}" for a in keywords for b in keywords]
+    for message in map(normalize_keyword_text, messages):
+        categories = expected(message)
+        assert match_keyword_categories(message) == categories, message
+        assert match_keyword_category(message) == (
+            categories[0] if categories else None
+        ), message
+
+
+def test_keyword_sets_are_frozen_and_lowercase():
+    """Keyword sets are immutable, lowercase and NFC (matched against normalized text)."""
+    import unicodedata
+
+    from agent.graph import DRUG_KEYWORDS, GUIDELINES_KEYWORDS, RESEARCH_KEYWORDS
+
+    for keywords in (DRUG_KEYWORDS, RESEARCH_KEYWORDS, GUIDELINES_KEYWORDS):
+        assert isinstance(keywords, frozenset)
+        assert all(kw == kw.lower() for kw in keywords)
+        assert all(unicodedata.is_normalized("NFC", kw) for kw in keywords)
+
+
+def test_route_query_with_decomposed_diacritics():
+    """Decomposed (NFD) input still matches composed Czech keywords."""
+    import unicodedata
+
+    content = unicodedata.normalize("NFD", "Dávkování LÉKU")
+    state = State(messages=[{"role": "user", "content": content}])
+
+    assert route_query(state) == "drug_agent"
+
+
+def test_route_query_without_diacritics():
+    """Queries typed without diacritics match Czech keywords."""
+    state = State(messages=[{"role": "user", "content": "Jake je davkovani leku?"}])
+
+    assert route_query(state) == "drug_agent"
+
+
+def test_normalize_keyword_text_strips_diacritics():
+    """Composed and decomposed Czech diacritics fold to lowercase ASCII."""
+    import unicodedata
+
+    from agent.utils.keyword_routing import normalize_keyword_text
+
+    text = "Příbalový LEták ŠŮ"
+    assert normalize_keyword_text(text) == "pribalovy letak su"
+    assert normalize_keyword_text(unicodedata.normalize("NFD", text)) == (
+        "pribalovy letak su"
+    )
+    # Case-folded rather than just lowercased
+    assert normalize_keyword_text("STRAẞE") == "strasse"
+    # Compatibility forms (no-break space, ligature) fold to plain text
+    assert normalize_keyword_text("klinická\u00a0studie") == "klinicka studie"
+    assert normalize_keyword_text("\ufb01nal") == "final"
+    # Per-message functions keep no cache of raw patient text
+    assert not hasattr(normalize_keyword_text, "cache_info")
+
+
+def test_match_keyword_categories_returns_all_in_priority_order():
+    """Multi-category matcher reports every category present, drug first."""
+    from agent.utils.keyword_routing import match_keyword_categories
+
+    assert match_keyword_categories("guidelines a studie o davkovani leku") == (
+        "drug",
+        "research",
+        "guidelines",
+    )
+    assert match_keyword_categories("studie o hypertenzi") == ("research",)
+    assert match_keyword_categories("ahoj jak se mas") == ()
+    assert not hasattr(match_keyword_categories, "cache_info")
+
+
+def test_match_keyword_categories_short_text():
+    """Texts shorter than any keyword skip the scan; 3-letter keywords still match."""
+    from agent.utils.keyword_routing import match_keyword_categories
+
+    assert match_keyword_categories("ok") == ()
+    assert match_keyword_categories("lek") == ("drug",)
+    assert match_keyword_categories("esc") == ("guidelines",)
+
+
+def test_short_keywords_match_only_at_word_start():
+    """Folded "lek" must not match inside elektro*/selektiv* words."""
+    from agent.utils.keyword_routing import (
+        match_keyword_categories,
+        normalize_keyword_text,
+    )
+
+    for text in ("elektrolyty", "elektrokardiogram", "selektivní inhibitory"):
+        assert match_keyword_categories(normalize_keyword_text(text)) == ()
+    assert match_keyword_categories(
+        normalize_keyword_text("Doporučené postupy pro elektrolyty")
+    ) == ("guidelines",)
+    assert match_keyword_categories(normalize_keyword_text("dávka léku")) == ("drug",)
@@ -0,0 +1,71 @@
+"""Unit tests for the in-process LLM response cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agent.utils.response_cache import ResponseCache, normalize_prompt
+
+
+def test_normalize_prompt_collapses_whitespace_and_case():
+    assert normalize_prompt("  Co je   IBUPROFEN?\n") == "co je ibuprofen?"
+
+
+def test_make_key_ignores_whitespace_and_case_but_not_model():
+    key = ResponseCache.make_key("model-a", "system", "Co je ibuprofen?")
+    assert key == ResponseCache.make_key("model-a", "system", "co je  ibuprofen?")
+    assert key != ResponseCache.make_key("model-b", "system", "Co je ibuprofen?")
+    assert key != ResponseCache.make_key("model-a", "other", "Co je ibuprofen?")
+
+
+def test_get_returns_stored_answer():
+    cache = ResponseCache()
+    cache.set("k", "odpověď")
+    assert cache.get("k") == "odpověď"
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl():
+    cache = ResponseCache(ttl=10)
+    with patch("agent.utils.response_cache.time.monotonic", return_value=100.0):
+        cache.set("k", "odpověď")
+    with patch("agent.utils.response_cache.time.monotonic", return_value=109.0):
+        assert cache.get("k") == "odpověď"
+    with patch("agent.utils.response_cache.time.monotonic", return_value=110.0):
+        assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_invalid_parameters_raise():
+    with pytest.raises(ValueError):
+        ResponseCache(ttl=0)
+    with pytest.raises(ValueError):
+        ResponseCache(max_size=0)
+    with pytest.raises(ValueError):
+        ResponseCache(max_entry_chars=0)
+
+
+def test_key_does_not_contain_prompt_text():
+    key = ResponseCache.make_key("model-a", "system", "Pacient Jan Novák, HIV+")
+    assert "novák" not in key.lower()
+    assert len(key) == 64
+
+
+def test_oversized_answer_is_not_cached():
+    cache = ResponseCache(max_entry_chars=5)
+    cache.set("k", "krátk")
+    assert cache.get("k") == "krátk"
+    cache.set("k", "příliš dlouhá odpověď")
+    assert cache.get("k") is None
+    assert len(cache) == 0